@@ -7,17 +7,19 @@ automática del proceso ETL.
 """
 
 import schedule
-import time
 import sys
+import threading
 from datetime import datetime
 from typing import Optional
 
 try:
     from app import config
+    from app.database import get_database
     from app.logger import get_logger
     from app.pipeline import ejecutar_etl_completo
 except ImportError:
     import config
+    from database import get_database
     from logger import get_logger
     from pipeline import ejecutar_etl_completo
 
@@ -33,18 +35,25 @@ class ETLScheduler:
     def __init__(self):
         self.logger = logger
         self.running = False
+        self._wake_event = threading.Event()
 
     def _tarea_programada(self):
         """Ejecuta el proceso ETL programado."""
         hora_actual = datetime.now()
-        self.logger.info(f"Iniciando tarea programada a las {hora_actual}")
+        self.logger.info("Iniciando tarea programada a las %s", hora_actual)
 
         try:
-            resultados = ejecutar_etl_completo(cargar_a_bd=True)
+            # Una única comprobación por ejecución en lugar de pool_pre_ping en
+            # cada checkout; si falla se procesan los archivos sin cargar a BD
+            cargar_a_bd = get_database().test_connection()
+            if not cargar_a_bd:
+                self.logger.warning("Base de datos no disponible: se omite la carga")
+
+            resultados = ejecutar_etl_completo(cargar_a_bd=cargar_a_bd, paralelo=True)
             self.logger.info("Tarea programada completada correctamente")
-            self.logger.info(f"Resultados: {resultados}")
+            self.logger.info("Resultados: %s", resultados)
         except Exception as e:
-            self.logger.error(f"Error en tarea programada: {e}")
+            self.logger.error("Error en tarea programada: %s", e)
 
     def iniciar(self, hora: Optional[str] = None, intervalo_minutos: Optional[int] = None):
         """
@@ -60,20 +69,26 @@ class ETLScheduler:
 
         if intervalo_minutos:
             schedule.every(intervalo_minutos).minutes.do(self._tarea_programada)
-            self.logger.info(f"Configurado: Ejecución cada {intervalo_minutos} minutos")
+            self.logger.info("Configurado: Ejecución cada %s minutos", intervalo_minutos)
         else:
             hora_ejecucion = hora or config.SCHEDULE_TIME
             schedule.every().day.at(hora_ejecucion).do(self._tarea_programada)
-            self.logger.info(f"Configurado: Ejecución diaria a las {hora_ejecucion}")
+            self.logger.info("Configurado: Ejecución diaria a las %s", hora_ejecucion)
 
         self.logger.info("Esperando próxima ejecución...")
         self.logger.info("Presione Ctrl+C para detener")
 
         self.running = True
+        self._wake_event.clear()
         try:
             while self.running:
+                # Dormir exactamente hasta la próxima tarea (sin sondeo periódico)
+                segundos = schedule.idle_seconds()
+                if segundos is None:
+                    break
+                if segundos > 0 and self._wake_event.wait(timeout=segundos):
+                    break
                 schedule.run_pending()
-                time.sleep(60)  # Revisar cada minuto
         except KeyboardInterrupt:
             self.logger.info("Programador detenido por el usuario")
             self.running = False
@@ -81,6 +96,7 @@ class ETLScheduler:
     def detener(self):
         """Detiene el programador."""
         self.running = False
+        self._wake_event.set()
         self.logger.info("Programador detenido")
 
 
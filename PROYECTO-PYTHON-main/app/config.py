@@ -8,12 +8,10 @@ y configuraciones de logging.
 """
 
 import os
+import re
 from pathlib import Path
 from dotenv import load_dotenv
 
-# Cargar variables de entorno
-load_dotenv()
-
 # =============================================================================
 # RUTAS DEL PROYECTO
 # =============================================================================
@@ -21,6 +19,12 @@ load_dotenv()
 # Directorio base del proyecto (un nivel arriba de app/)
 BASE_DIR = Path(__file__).resolve().parent.parent
 
+# Cargar variables de entorno desde la ruta conocida del .env (evita que
+# find_dotenv recorra directorios en cada arranque del CLI o del scheduler)
+ENV_FILE = BASE_DIR / ".env"
+if ENV_FILE.is_file():
+    load_dotenv(ENV_FILE)
+
 # Directorios de datos
 DATA_DIR = BASE_DIR / "data"
 INPUT_DIR = DATA_DIR / "input"
@@ -53,6 +57,19 @@ DATABASE_URL = (
     f"@{DB_CONFIG['host']}:{DB_CONFIG['port']}/{DB_CONFIG['database']}"
 )
 
+# Carga masiva con COPY FROM STDIN (0 para usar INSERT por lotes)
+DB_USE_COPY = os.getenv("ETL_DB_COPY", "1") == "1"
+
+# Filas por sentencia INSERT ... VALUES multi-fila cuando no se usa COPY (se
+# reduce si hace falta para no superar el máximo de parámetros por sentencia)
+LOAD_CHUNKSIZE = int(os.getenv("ETL_LOAD_CHUNKSIZE", "1000"))
+
+# Modo carga masiva: se retira UNIQUE(dni) durante la carga de clientes y se
+# recrea al final (cada archivo de clientes se carga entero, sin bloques, para
+# reconstruir el índice una sola vez); en tarjetas se omite la comprobación de
+# la FK (requiere permisos de superusuario para session_replication_role)
+BULK_LOAD_MODE = os.getenv("ETL_BULK_LOAD_MODE", "0") == "1"
+
 # =============================================================================
 # CONFIGURACIÓN DE DROPBOX
 # =============================================================================
@@ -67,10 +84,28 @@ FILE_ENCODING = "utf-8"
 FILE_ENCODING_FALLBACK = "latin-1"
 CSV_SEPARATOR = ";"
 
+# Motor de lectura y escritura de CSV: "pyarrow" (multihilo, si está
+# instalado) o "c"
+CSV_ENGINE = os.getenv("ETL_CSV_ENGINE", "pyarrow")
+
+# Los archivos a partir de este tamaño se procesan por bloques de
+# CSV_CHUNKSIZE filas para acotar la memoria; los menores se leen enteros
+CSV_CHUNKSIZE = int(os.getenv("ETL_CSV_CHUNKSIZE", "100000"))
+CSV_STREAM_MIN_BYTES = 64 * 1024 * 1024  # 64 MB
+
+# Procesos por pipeline para tratar varios archivos en paralelo (1 = secuencial,
+# 0 = núcleos disponibles). Los dos pipelines pueden ejecutarse a la vez, así que
+# el total de procesos puede llegar al doble
+PIPELINE_WORKERS = int(os.getenv("ETL_WORKERS", "1")) or (os.cpu_count() or 1)
+
 # Patrones para detectar archivos
 CLIENTES_PATTERN = r"Clientes-\d{4}-\d{2}-\d{2}\.csv"
 TARJETAS_PATTERN = r"Tarjetas-\d{4}-\d{2}-\d{2}\.csv"
 
+# Patrones precompilados una sola vez al importar
+CLIENTES_RE = re.compile(CLIENTES_PATTERN)
+TARJETAS_RE = re.compile(TARJETAS_PATTERN)
+
 # =============================================================================
 # CONFIGURACIÓN DE SEGURIDAD
 # =============================================================================
@@ -78,6 +113,10 @@ TARJETAS_PATTERN = r"Tarjetas-\d{4}-\d{2}-\d{2}\.csv"
 # Salt para hashing de datos sensibles
 HASH_SALT = os.getenv("ETL_HASH_SALT", "proyecto_etl_salt_secret_2026")
 
+# Algoritmo de hash: "sha256" (por defecto) o "blake2b" (más rápido, mismo
+# tamaño de salida). Cambiarlo altera todos los hashes ya guardados en BD.
+HASH_ALGO = os.getenv("ETL_HASH_ALGO", "sha256")
+
 # =============================================================================
 # CONFIGURACIÓN DE LOGGING
 # =============================================================================
@@ -87,6 +126,14 @@ LOG_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
 LOG_MAX_BYTES = 10 * 1024 * 1024  # 10 MB
 LOG_BACKUP_COUNT = 5
 
+# Archivos de log en JSON (una línea por registro) en lugar de texto plano
+LOG_JSON = os.getenv("LOG_JSON", "0") == "1"
+
+# Registros acumulados en memoria antes de escribir a disco (0 = sin búfer)
+# y segundos entre volcados periódicos; ERROR y superiores se escriben al momento
+LOG_BUFFER_CAPACITY = int(os.getenv("LOG_BUFFER_CAPACITY", "1024"))
+LOG_FLUSH_INTERVAL = 2.0
+
 # =============================================================================
 # CONFIGURACIÓN DE AUTOMATIZACIÓN
 # =============================================================================
@@ -9,6 +9,10 @@ Gestiona todas las operaciones de base de datos:
 - Consultas
 """
 
+import io
+import threading
+
+import pandas as pd
 from sqlalchemy import create_engine, text
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.exc import SQLAlchemyError
@@ -23,50 +27,40 @@ except ImportError:
 
 logger = get_logger("database")
 
+# Columnas que se cargan en cada tabla (el resto de columnas del CSV se ignora)
+CLIENTS_COLUMNS = [
+    "cod_cliente", "nombre", "apellido1", "apellido2",
+    "dni", "dni_hash", "correo", "telefono",
+]
+TARJETAS_COLUMNS = [
+    "cod_cliente", "numero_tarjeta_hash", "numero_tarjeta_masked",
+    "fecha_exp", "cvv_hash",
+]
 
-class Database:
-    """
-    Clase para gestionar la conexión y operaciones de base de datos.
-    """
+# Engine compartido por todo el proceso (se crea en el primer uso)
+_engine = None
+_engine_lock = threading.Lock()
 
-    _instance = None
-    _engine = None
+# Máximo de parámetros enlazados por sentencia que admite pg8000
+_MAX_PARAMETROS_SENTENCIA = 32767
 
-    def __new__(cls):
-        """Implementa patrón Singleton"""
-        if cls._instance is None:
-            cls._instance = super(Database, cls).__new__(cls)
-            cls._instance._initialized = False
-        return cls._instance
 
-    def __init__(self):
-        """Inicializa la conexión a la base de datos"""
-        if self._initialized:
-            return
+class Database:
+    """
+    Clase para gestionar la conexión y operaciones de base de datos.
 
-        self._initialized = True
-        self._engine = None
+    No guarda estado propio: todas las instancias comparten el engine
+    del módulo, por lo que crearlas es barato.
+    """
 
     def get_engine(self):
         """
-        Obtiene o crea el engine de SQLAlchemy.
+        Obtiene el engine de SQLAlchemy compartido.
 
         Returns:
             Engine: Motor de SQLAlchemy
         """
-        if self._engine is None:
-            try:
-                self._engine = create_engine(
-                    config.DATABASE_URL,
-                    pool_pre_ping=True,
-                    pool_recycle=3600,
-                )
-                logger.info("Conexión a base de datos establecida correctamente")
-            except Exception as e:
-                logger.error(f"Error al conectar a la base de datos: {e}")
-                raise
-
-        return self._engine
+        return get_engine()
 
     @contextmanager
     def get_connection(self):
@@ -83,7 +77,7 @@ class Database:
             conn.commit()
         except Exception as e:
             conn.rollback()
-            logger.error(f"Error en transacción: {e}")
+            logger.error("Error en transacción: %s", e)
             raise
         finally:
             conn.close()
@@ -120,13 +114,20 @@ class Database:
             )
         """
 
+        # Tabla intermedia sin WAL para las cargas con COPY (ver insert_clients)
+        create_clients_stage_sql = """
+            CREATE UNLOGGED TABLE IF NOT EXISTS clients_stage
+                (LIKE clients INCLUDING DEFAULTS)
+        """
+
         try:
             with self.get_connection() as conn:
                 conn.execute(text(create_clients_sql))
                 conn.execute(text(create_tarjetas_sql))
+                conn.execute(text(create_clients_stage_sql))
                 logger.info("✓ Tablas creadas correctamente")
         except SQLAlchemyError as e:
-            logger.error(f"Error al crear tablas: {e}")
+            logger.error("Error al crear tablas: %s", e)
             raise
 
     def insert_clients(self, df):
@@ -153,40 +154,35 @@ class Database:
             
             skipped_count = initial_count - len(df_new)
             if skipped_count > 0:
-                logger.info(f"  ⚠ Se omitieron {skipped_count} clientes que ya existen en la BD")
+                logger.info("  ⚠ Se omitieron %s clientes que ya existen en la BD", skipped_count)
             
             if df_new.empty:
                 logger.info("  ✓ No hay clientes nuevos para insertar")
                 return 0
 
-            # Definir columnas esperadas en la tabla clients
-            expected_cols = [
-                "cod_cliente", "nombre", "apellido1", "apellido2", 
-                "dni", "dni_hash", "correo", "telefono"
-            ]
-            
-            # Filtrar solo las columnas que existen
-            cols_to_insert = [c for c in expected_cols if c in df_new.columns]
+            # Filtrar solo las columnas de la tabla que existen
+            cols_to_insert = [c for c in CLIENTS_COLUMNS if c in df_new.columns]
             df_final = df_new[cols_to_insert]
 
-            engine = self.get_engine()
-            with engine.begin() as conn:
-                df_final.to_sql("clients", con=conn, if_exists="append", index=False)
-
-            count = len(df_final)
-            logger.info(f"  ✓ {count} registros de clientes nuevos insertados correctamente")
+            count = self._bulk_insert(
+                df_final, "clients", staging="clients_stage", conflicto="cod_cliente"
+            )
+            logger.info("  ✓ %s registros de clientes nuevos insertados correctamente", count)
             return count
 
         except SQLAlchemyError as e:
-            logger.error(f"Error al insertar clientes: {e}")
+            logger.error("Error al insertar clientes: %s", e)
             raise
 
-    def insert_tarjetas(self, df):
+    def insert_tarjetas(self, df, existing_clients=None):
         """
         Inserta registros de tarjetas en la base de datos.
 
         Args:
             df: DataFrame con los datos de tarjetas
+            existing_clients: Códigos de cliente ya consultados (opcional); al
+                cargar por bloques se pasan para no repetir la consulta en
+                cada bloque
 
         Returns:
             int: Número de registros insertados
@@ -197,7 +193,8 @@ class Database:
 
         try:
             # Obtener clientes existentes para verificar integridad referencial
-            existing_clients = self.get_existing_clients()
+            if existing_clients is None:
+                existing_clients = self.get_existing_clients()
             
             # Filtrar tarjetas cuyos clientes existen en BD
             initial_count = len(df)
@@ -205,48 +202,201 @@ class Database:
             
             skipped_count = initial_count - len(df_valid_clients)
             if skipped_count > 0:
-                logger.info(f"  ⚠ Se omitieron {skipped_count} tarjetas de clientes no existentes en la BD")
+                logger.info("  ⚠ Se omitieron %s tarjetas de clientes no existentes en la BD", skipped_count)
             
             if df_valid_clients.empty:
                 logger.info("  ✓ No hay tarjetas válidas para insertar (clientes no encontrados)")
                 return 0
 
-            # Definir columnas esperadas en la tabla tarjetas
-            expected_cols = [
-                "cod_cliente", "numero_tarjeta_hash", "numero_tarjeta_masked", 
-                "fecha_exp", "cvv_hash"
-            ]
-            
-            # Filtrar solo las columnas que existen
-            cols_to_insert = [c for c in expected_cols if c in df_valid_clients.columns]
+            # Filtrar solo las columnas de la tabla que existen
+            cols_to_insert = [c for c in TARJETAS_COLUMNS if c in df_valid_clients.columns]
             df_final = df_valid_clients[cols_to_insert]
             
-            engine = self.get_engine()
-            with engine.begin() as conn:
-                df_final.to_sql("tarjetas", con=conn, if_exists="append", index=False)
-
-            count = len(df_final)
-            logger.info(f"✓ {count} registros de tarjetas insertados correctamente")
+            count = self._bulk_insert(df_final, "tarjetas")
+            logger.info("✓ %s registros de tarjetas insertados correctamente", count)
             return count
 
         except SQLAlchemyError as e:
-            logger.error(f"Error al insertar tarjetas: {e}")
+            logger.error("Error al insertar tarjetas: %s", e)
+            raise
+
+    def _bulk_insert(self, df, tabla, staging=None, conflicto=None):
+        """
+        Carga un DataFrame en una tabla usando COPY ... FROM STDIN.
+
+        Si el driver no dispone de COPY (o está desactivado con ETL_DB_COPY=0)
+        se recurre a DataFrame.to_sql con INSERT ... VALUES de varias filas.
+
+        Con ``staging`` el COPY se hace sobre esa tabla UNLOGGED y, en la misma
+        transacción, se pasa a la tabla destino con INSERT ... SELECT ... ON
+        CONFLICT DO NOTHING y se vacía la tabla intermedia.
+
+        Args:
+            df: DataFrame con las columnas a insertar
+            tabla: Nombre de la tabla destino
+            staging: Tabla intermedia UNLOGGED (opcional)
+            conflicto: Columna de conflicto para ON CONFLICT (con staging)
+
+        Returns:
+            int: Número de registros insertados en la tabla destino
+        """
+        antes, despues = self._sentencias_bulk_load(tabla)
+
+        if not self._usa_copy():
+            # method="multi": una sentencia VALUES (...), (...) por lote, con
+            # tantas filas como permita el límite de parámetros
+            filas_por_sentencia = max(
+                1, min(config.LOAD_CHUNKSIZE, _MAX_PARAMETROS_SENTENCIA // len(df.columns))
+            )
+            with self.get_engine().begin() as conn:
+                for sentencia in antes:
+                    conn.execute(text(sentencia))
+                df.to_sql(
+                    tabla,
+                    con=conn,
+                    if_exists="append",
+                    index=False,
+                    chunksize=filas_por_sentencia,
+                    method="multi",
+                )
+                for sentencia in despues:
+                    conn.execute(text(sentencia))
+            return len(df)
+
+        buffer = io.StringIO()
+        df.to_csv(buffer, sep="\t", header=False, index=False, na_rep="\\N")
+        buffer.seek(0)
+
+        columnas = ", ".join(df.columns)
+        copy_opciones = "WITH (FORMAT csv, DELIMITER E'\\t', NULL '\\N')"
+
+        if staging is None:
+            self._ejecutar_copy(
+                f"COPY {tabla} ({columnas}) FROM STDIN {copy_opciones}",
+                buffer,
+                antes=antes,
+                despues=despues,
+            )
+            return len(df)
+
+        # El TRUNCATE inicial bloquea la tabla intermedia hasta el commit,
+        # de modo que dos cargas simultáneas no se mezclan
+        filas = self._ejecutar_copy(
+            f"COPY {staging} ({columnas}) FROM STDIN {copy_opciones}",
+            buffer,
+            antes=[f"TRUNCATE {staging}"] + antes,
+            despues=[
+                f"INSERT INTO {tabla} ({columnas}) "
+                f"SELECT {columnas} FROM {staging} "
+                f"ON CONFLICT ({conflicto}) DO NOTHING",
+            ]
+            + despues
+            + [f"TRUNCATE {staging}"],
+        )
+        return filas[0]
+
+    def _sentencias_bulk_load(self, tabla):
+        """
+        Sentencias que rodean la carga cuando BULK_LOAD_MODE está activo.
+
+        En clients se retira UNIQUE(dni) y se recrea tras la carga (construir
+        el índice una vez es más barato que mantenerlo fila a fila); en
+        tarjetas se desactiva la comprobación de la FK, ya garantizada por el
+        filtrado previo de insert_tarjetas. Todo ocurre en la misma
+        transacción que la carga, así que un fallo deja la tabla intacta.
+
+        Args:
+            tabla: Nombre de la tabla destino
+
+        Returns:
+            tuple: (sentencias previas, sentencias posteriores)
+        """
+        if not config.BULK_LOAD_MODE or self.get_engine().dialect.name != "postgresql":
+            return [], []
+
+        if tabla == "clients":
+            return (
+                ["ALTER TABLE clients DROP CONSTRAINT IF EXISTS clients_dni_key"],
+                ["ALTER TABLE clients ADD CONSTRAINT clients_dni_key UNIQUE (dni)"],
+            )
+        if tabla == "tarjetas":
+            return ["SET LOCAL session_replication_role = replica"], []
+        return [], []
+
+    def _usa_copy(self):
+        """
+        Indica si las cargas y lecturas masivas pueden usar COPY.
+
+        Returns:
+            bool: True si COPY está activado y el driver lo soporta
+        """
+        engine = self.get_engine()
+        return (
+            config.DB_USE_COPY
+            and engine.dialect.name == "postgresql"
+            and engine.dialect.driver in ("pg8000", "psycopg2")
+        )
+
+    def _ejecutar_copy(self, copy_sql, stream, antes=(), despues=()):
+        """
+        Ejecuta una sentencia COPY sobre la conexión DBAPI del pool.
+
+        Args:
+            copy_sql: Sentencia COPY ... FROM STDIN / TO STDOUT
+            stream: Buffer de lectura (FROM) o de escritura (TO)
+            antes: Sentencias a ejecutar antes del COPY en la misma transacción
+            despues: Sentencias a ejecutar tras el COPY en la misma transacción
+
+        Returns:
+            list: Filas afectadas por cada sentencia de ``despues``
+        """
+        raw_conn = self.get_engine().raw_connection()
+        try:
+            cursor = raw_conn.cursor()
+            for sentencia in antes:
+                cursor.execute(sentencia)
+            if hasattr(cursor, "copy_expert"):  # psycopg2
+                cursor.copy_expert(copy_sql, stream)
+            else:  # pg8000
+                cursor.execute(copy_sql, stream=stream)
+            filas = []
+            for sentencia in despues:
+                cursor.execute(sentencia)
+                filas.append(cursor.rowcount)
+            raw_conn.commit()
+            return filas
+        except Exception:
+            raw_conn.rollback()
             raise
+        finally:
+            raw_conn.close()
 
     def get_existing_clients(self):
         """
-        Obtiene la lista de códigos de cliente existentes.
+        Obtiene los códigos de cliente existentes.
+
+        Con PostgreSQL se vuelca la columna con COPY ... TO STDOUT y se
+        separa por líneas, sin construir una tupla por fila. Se devuelve un
+        pd.Index para que Series.isin lo use directamente en su tabla hash,
+        sin pasar por un set de Python que luego habría que volver a listar.
 
         Returns:
-            set: Conjunto de códigos de cliente
+            pd.Index: Códigos de cliente
         """
         try:
+            if self._usa_copy():
+                buffer = io.BytesIO()
+                self._ejecutar_copy(
+                    "COPY (SELECT cod_cliente FROM clients) TO STDOUT", buffer
+                )
+                return pd.Index(buffer.getvalue().decode("utf-8").splitlines(), dtype=str)
+
             with self.get_connection() as conn:
                 result = conn.execute(text("SELECT cod_cliente FROM clients"))
-                return set(row[0] for row in result)
-        except SQLAlchemyError as e:
-            logger.error(f"Error al obtener clientes existentes: {e}")
-            return set()
+                return pd.Index(result.scalars().all(), dtype=str)
+        except Exception as e:
+            logger.error("Error al obtener clientes existentes: %s", e)
+            return pd.Index([], dtype=str)
 
     def test_connection(self):
         """
@@ -261,7 +411,7 @@ class Database:
                 logger.info("✓ Conexión a base de datos verificada")
                 return True
         except Exception as e:
-            logger.error(f"✗ Error de conexión: {e}")
+            logger.error("✗ Error de conexión: %s", e)
             return False
 
 
@@ -272,13 +422,24 @@ class Database:
 
 def get_engine():
     """
-    Función helper para obtener el engine de SQLAlchemy.
+    Obtiene o crea (una sola vez, de forma segura entre hilos) el engine.
 
     Returns:
         Engine: Motor de SQLAlchemy
     """
-    db = Database()
-    return db.get_engine()
+    global _engine
+
+    if _engine is None:
+        with _engine_lock:
+            if _engine is None:
+                try:
+                    _engine = create_engine(config.DATABASE_URL, pool_recycle=1800)
+                    logger.info("Conexión a base de datos establecida correctamente")
+                except Exception as e:
+                    logger.error("Error al conectar a la base de datos: %s", e)
+                    raise
+
+    return _engine
 
 
 def get_database():
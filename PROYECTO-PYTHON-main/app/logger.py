@@ -3,15 +3,25 @@ Sistema de Logging Centralizado
 ===============================
 
 Proporciona un sistema de logging unificado con:
-- Logging a archivo con rotación automática
+- Logging a archivo con rotación automática y escritura en búfer
 - Logging a consola
-- Formato consistente
+- Formato consistente (texto o JSON con LOG_JSON=1)
 - Patrón Singleton para gestión centralizada
 """
 
+import atexit
+import json
 import logging
 import sys
-from logging.handlers import RotatingFileHandler, TimedRotatingFileHandler
+import threading
+from contextlib import contextmanager
+from logging.handlers import (
+    MemoryHandler,
+    QueueHandler,
+    QueueListener,
+    RotatingFileHandler,
+    TimedRotatingFileHandler,
+)
 from pathlib import Path
 from datetime import datetime
 
@@ -21,6 +31,37 @@ try:
 except ImportError:
     import config
 
+# orjson es opcional: si no está instalado se usa json de la librería estándar
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Señal para detener el hilo de volcado periódico de logs al salir, y cerrojo
+# para que ese hilo se arranque una sola vez aunque se creen loggers en paralelo
+_detener_volcado = threading.Event()
+_arranque_volcado = threading.Lock()
+
+
+class JSONFormatter(logging.Formatter):
+    """
+    Formatea cada registro como un objeto JSON en una sola línea.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        registro = {
+            "ts": record.created,
+            "name": record.name,
+            "lvl": record.levelname,
+            "msg": record.getMessage(),
+        }
+        if record.exc_info:
+            registro["exc"] = self.formatException(record.exc_info)
+
+        if orjson is not None:
+            return orjson.dumps(registro, default=str).decode()
+        return json.dumps(registro, ensure_ascii=False, default=str)
+
 
 class ETLLogger:
     """
@@ -30,6 +71,8 @@ class ETLLogger:
 
     _instance = None
     _loggers = {}
+    # Cola hacia el proceso padre (solo en procesos hijos, ver usar_cola)
+    _cola = None
 
     def __new__(cls):
         """Implementa patrón Singleton"""
@@ -46,6 +89,8 @@ class ETLLogger:
         self._initialized = True
         self.log_dir = config.LOGS_DIR
         self.log_dir.mkdir(parents=True, exist_ok=True)
+        self._buffered_handlers = []
+        self._flush_thread = None
 
     def get_logger(
         self,
@@ -71,11 +116,19 @@ class ETLLogger:
         if name in self._loggers:
             return self._loggers[name]
 
+        nivel = getattr(logging, level.upper())
         logger = logging.getLogger(name)
-        logger.setLevel(getattr(logging, level.upper()))
+        logger.setLevel(nivel)
         logger.propagate = False
         logger.handlers.clear()
 
+        # En un proceso hijo los registros se envían al padre, que es el
+        # único que escribe (y rota) los archivos de log
+        if self._cola is not None:
+            logger.addHandler(QueueHandler(self._cola))
+            self._loggers[name] = logger
+            return logger
+
         formatter = logging.Formatter(
             fmt=config.LOG_FORMAT, datefmt=config.LOG_DATE_FORMAT
         )
@@ -83,29 +136,56 @@ class ETLLogger:
         # Handler para consola
         if console:
             console_handler = logging.StreamHandler(sys.stdout)
-            console_handler.setLevel(logging.DEBUG)
+            console_handler.setLevel(nivel)
             console_handler.setFormatter(formatter)
             logger.addHandler(console_handler)
 
         # Handler para archivo
         if file:
-            file_handler = self._create_file_handler(name, rotation_type)
-            file_handler.setLevel(logging.DEBUG)
-            file_handler.setFormatter(formatter)
+            file_handler = self._create_file_handler(
+                name,
+                rotation_type,
+                JSONFormatter() if config.LOG_JSON else formatter,
+            )
+            file_handler.setLevel(nivel)
             logger.addHandler(file_handler)
 
         self._loggers[name] = logger
         return logger
 
+    def usar_cola(self, cola):
+        """
+        Redirige todos los loggers, actuales y futuros, a una cola.
+
+        Se usa en los procesos hijos: sus handlers de consola y archivo se
+        cierran y cada registro se envía al proceso padre a través de la
+        cola (ver reenviar_logs_de_procesos).
+
+        Args:
+            cola: Cola de multiprocessing compartida con el proceso padre
+        """
+        ETLLogger._cola = cola
+        for logger in self._loggers.values():
+            for handler in list(logger.handlers):
+                logger.removeHandler(handler)
+                handler.close()
+            logger.addHandler(QueueHandler(cola))
+        self._buffered_handlers.clear()
+
     def _create_file_handler(
-        self, logger_name: str, rotation_type: str
+        self, logger_name: str, rotation_type: str, formatter: logging.Formatter
     ) -> logging.Handler:
         """
         Crea un handler de archivo con rotación.
 
+        Salvo que LOG_BUFFER_CAPACITY sea 0, el handler se envuelve en un
+        MemoryHandler que escribe a disco al llenarse, cada
+        LOG_FLUSH_INTERVAL segundos o inmediatamente ante un ERROR.
+
         Args:
             logger_name: Nombre del logger
             rotation_type: Tipo de rotación ('size' o 'time')
+            formatter: Formateador de los registros
 
         Returns:
             logging.Handler: Handler configurado
@@ -128,7 +208,46 @@ class ETLLogger:
                 encoding="utf-8",
             )
 
-        return handler
+        handler.setLevel(logging.DEBUG)
+        handler.setFormatter(formatter)
+
+        if config.LOG_BUFFER_CAPACITY <= 0:
+            return handler
+
+        buffered = MemoryHandler(
+            capacity=config.LOG_BUFFER_CAPACITY,
+            flushLevel=logging.ERROR,
+            target=handler,
+            flushOnClose=True,
+        )
+        buffered.setLevel(logging.DEBUG)
+        self._buffered_handlers.append(buffered)
+        self._start_flush_thread()
+        return buffered
+
+    def _start_flush_thread(self):
+        """Arranca (una sola vez) el hilo que vuelca los búferes periódicamente."""
+        with _arranque_volcado:
+            if self._flush_thread is not None:
+                return
+
+            def volcar_periodicamente():
+                while not _detener_volcado.wait(config.LOG_FLUSH_INTERVAL):
+                    for buffered in list(self._buffered_handlers):
+                        buffered.flush()
+
+            self._flush_thread = threading.Thread(
+                target=volcar_periodicamente, name="log-flush", daemon=True
+            )
+            self._flush_thread.start()
+            atexit.register(self._stop_flush_thread)
+
+    def _stop_flush_thread(self):
+        """Detiene el hilo de volcado y vuelca por última vez los búferes."""
+        _detener_volcado.set()
+        self._flush_thread.join()
+        for buffered in list(self._buffered_handlers):
+            buffered.flush()
 
 
 # =============================================================================
@@ -147,10 +266,69 @@ def get_logger(name: str = "etl", level: str = "INFO") -> logging.Logger:
     Returns:
         logging.Logger: Logger configurado
     """
+    logger = ETLLogger._loggers.get(name)
+    if logger is not None:
+        return logger
+
     etl_logger = ETLLogger()
     return etl_logger.get_logger(name, level)
 
 
+def flush_logs():
+    """
+    Vuelca a disco los registros pendientes de los handlers con búfer.
+
+    Los procesos hijos no tienen búfer propio: sus registros llegan al
+    padre a través de la cola (ver reenviar_logs_de_procesos).
+    """
+    for buffered in list(ETLLogger()._buffered_handlers):
+        buffered.flush()
+
+
+class _ReenvioAlLogger(logging.Handler):
+    """
+    Entrega cada registro recibido de un proceso hijo al logger del mismo
+    nombre en el proceso padre, con sus handlers de consola y archivo.
+    """
+
+    def emit(self, record: logging.LogRecord):
+        get_logger(record.name).handle(record)
+
+
+def usar_cola_en_proceso_hijo(cola):
+    """
+    Inicializador de procesos hijos: envía sus logs al proceso padre.
+
+    Args:
+        cola: Cola creada por reenviar_logs_de_procesos
+    """
+    ETLLogger().usar_cola(cola)
+
+
+@contextmanager
+def reenviar_logs_de_procesos(contexto):
+    """
+    Recibe en el proceso padre los logs de sus procesos hijos.
+
+    Varios procesos escribiendo y rotando los mismos archivos pueden perder
+    o pisar líneas; así solo escribe el padre. Los hijos deben inicializarse
+    con usar_cola_en_proceso_hijo y la cola devuelta.
+
+    Args:
+        contexto: Contexto de multiprocessing con el que se crean los hijos
+
+    Yields:
+        Queue: Cola que se pasa a los procesos hijos
+    """
+    cola = contexto.Queue()
+    listener = QueueListener(cola, _ReenvioAlLogger())
+    listener.start()
+    try:
+        yield cola
+    finally:
+        listener.stop()
+
+
 def get_pipeline_logger(pipeline_name: str) -> logging.Logger:
     """
     Crea un logger específico para un pipeline.
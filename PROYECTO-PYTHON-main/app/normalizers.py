@@ -14,6 +14,8 @@ import re
 import unicodedata
 from typing import Optional
 
+import pandas as pd
+
 try:
     from app.logger import get_logger
 except ImportError:
@@ -21,6 +23,29 @@ except ImportError:
 
 logger = get_logger("normalizers")
 
+# Patrones precompilados (se reutilizan en cada fila/columna)
+_NONDIGIT_RE = re.compile(r"\D")
+_DNI_STRIP_RE = re.compile(r"[ -]")
+_NO_ASCII_RE = re.compile(r"[^\x00-\x7f]")
+
+
+def _quitar_combinantes(texto: str) -> str:
+    """Descompone en NFD y descarta las marcas diacríticas."""
+    texto_nfd = unicodedata.normalize("NFD", texto)
+    return "".join(c for c in texto_nfd if not unicodedata.combining(c))
+
+
+# Tabla de traducción para los caracteres latinos acentuados (Latin-1 y
+# Latin Extended-A/B). Se calcula una vez al importar con la misma regla NFD
+# para que el resultado sea idéntico al de la descomposición completa.
+_ACCENT_MAP = str.maketrans(
+    {
+        chr(cp): _quitar_combinantes(chr(cp))
+        for cp in range(0xC0, 0x250)
+        if _quitar_combinantes(chr(cp)) != chr(cp)
+    }
+)
+
 
 def eliminar_acentos(texto: str) -> str:
     """
@@ -35,9 +60,12 @@ def eliminar_acentos(texto: str) -> str:
     if not isinstance(texto, str):
         return texto
 
-    texto_nfd = unicodedata.normalize("NFD", texto)
-    sin_acentos = "".join(c for c in texto_nfd if not unicodedata.combining(c))
-    return sin_acentos
+    sin_acentos = texto.translate(_ACCENT_MAP)
+    if sin_acentos.isascii():
+        return sin_acentos
+
+    # Caracteres fuera de la tabla (marcas sueltas, otros alfabetos)
+    return _quitar_combinantes(sin_acentos)
 
 
 def normalizar_texto(valor: str) -> str:
@@ -85,7 +113,7 @@ def normalizar_dni(dni: str) -> str:
     if not isinstance(dni, str):
         return str(dni) if dni else ""
 
-    return dni.strip().replace(" ", "").replace("-", "").upper()
+    return _DNI_STRIP_RE.sub("", dni.strip()).upper()
 
 
 def normalizar_correo(correo: str) -> str:
@@ -117,7 +145,7 @@ def normalizar_telefono(telefono: str) -> str:
     if not telefono:
         return ""
 
-    return re.sub(r"\D", "", str(telefono))
+    return _NONDIGIT_RE.sub("", str(telefono))
 
 
 def normalizar_numero_tarjeta(numero: str) -> str:
@@ -133,7 +161,7 @@ def normalizar_numero_tarjeta(numero: str) -> str:
     if not numero:
         return ""
 
-    return "".join(filter(str.isdigit, str(numero)))
+    return _NONDIGIT_RE.sub("", str(numero))
 
 
 def normalizar_cvv(cvv: str) -> str:
@@ -149,27 +177,92 @@ def normalizar_cvv(cvv: str) -> str:
     if not cvv:
         return ""
 
-    return "".join(filter(str.isdigit, str(cvv)))
+    return _NONDIGIT_RE.sub("", str(cvv))
+
+
+def _nombres_columnas_normalizados(columnas) -> pd.Index:
+    """
+    Calcula los nombres normalizados (minúsculas, sin acentos, con "_").
+
+    Args:
+        columnas: Nombres de columna originales
+
+    Returns:
+        pd.Index: Nombres normalizados
+    """
+    nombres = _cambiar_mayusculas(pd.Series(columnas, dtype=str).str.strip(), "lower")
+    nombres = eliminar_acentos_series(nombres).str.replace(" ", "_", regex=False)
+    return pd.Index(nombres)
+
+
+def _columnas_texto(df) -> pd.Index:
+    """
+    Devuelve las columnas de texto (object o str) de un DataFrame.
+
+    Args:
+        df: DataFrame a inspeccionar
+
+    Returns:
+        pd.Index: Nombres de las columnas de texto
+    """
+    return df.select_dtypes(include=["object", "string"]).columns
+
+
+def transformar_dataframe(df, normalizadores=None, sufijo=""):
+    """
+    Normaliza los nombres de columna, elimina espacios de las columnas de
+    texto y aplica los normalizadores, escribiendo cada columna una sola vez.
+
+    Args:
+        df: DataFrame a transformar
+        normalizadores: Diccionario columna -> normalizador vectorizado
+        sufijo: Si se indica, el resultado de cada normalizador se guarda en
+            una columna nueva ``{columna}{sufijo}`` y la original solo se
+            limpia de espacios
+
+    Returns:
+        DataFrame: DataFrame transformado
+    """
+    normalizadores = normalizadores or {}
+    df.columns = _nombres_columnas_normalizados(df.columns)
+    columnas_texto = set(_columnas_texto(df))
+
+    for columna in list(df.columns):
+        normalizador = normalizadores.get(columna)
+        if columna not in columnas_texto and normalizador is None:
+            continue
+
+        # Todos los normalizadores eliminan ya los espacios de los extremos:
+        # la columna solo se recorre aparte con strip si no se normaliza aquí
+        serie = df[columna]
+        if normalizador is not None and not sufijo:
+            serie = normalizador(serie)
+        elif columna in columnas_texto:
+            serie = serie.str.strip()
+        df[columna] = serie
+
+    # Las columnas derivadas se añaden en el orden del diccionario
+    if sufijo:
+        for columna, normalizador in normalizadores.items():
+            if columna in df.columns:
+                df[f"{columna}{sufijo}"] = normalizador(df[columna])
+
+    return df
 
 
 def normalizar_columnas_dataframe(df):
     """
     Normaliza los nombres de las columnas de un DataFrame.
 
+    Se mantiene por compatibilidad; el pipeline usa transformar_dataframe.
+
     Args:
         df: DataFrame a normalizar
 
     Returns:
         DataFrame: DataFrame con columnas normalizadas
     """
-    nuevos_nombres = {}
-    for col in df.columns:
-        nuevo_nombre = col.strip().lower()
-        nuevo_nombre = eliminar_acentos(nuevo_nombre)
-        nuevo_nombre = nuevo_nombre.replace(" ", "_")
-        nuevos_nombres[col] = nuevo_nombre
-
-    df.rename(columns=nuevos_nombres, inplace=True)
+    df.columns = _nombres_columnas_normalizados(df.columns)
     return df
 
 
@@ -177,34 +270,234 @@ def limpiar_espacios_dataframe(df):
     """
     Elimina espacios en blanco de todas las columnas de texto.
 
+    Se mantiene por compatibilidad; el pipeline usa transformar_dataframe.
+
     Args:
         df: DataFrame a limpiar
 
     Returns:
         DataFrame: DataFrame con espacios eliminados
     """
-    for col in df.columns:
-        if df[col].dtype == "object":
-            df[col] = df[col].str.strip()
+    for col in _columnas_texto(df):
+        df[col] = df[col].str.strip()
 
     return df
 
 
+# =============================================================================
+# NORMALIZADORES VECTORIZADOS (COLUMNA COMPLETA)
+# =============================================================================
+
+
+def _cambiar_mayusculas(serie: pd.Series, metodo: str) -> pd.Series:
+    """
+    Aplica upper/lower/title de Python a una columna de texto.
+
+    Con pyarrow instalado, el dtype str de pandas usa los kernels de Arrow,
+    que no siguen el mapeo de Python ("Straße".upper() da "STRAẞE" en vez de
+    "STRASSE", las ligaduras no se expanden, "Ǆ" no pasa a "ǅ"...). La
+    operación se hace sobre object para conservar la salida de str.upper,
+    str.lower y str.title, y se restaura el dtype original.
+
+    Args:
+        serie: Columna de texto
+        metodo: "upper", "lower" o "title"
+
+    Returns:
+        pd.Series: Columna transformada, con el mismo dtype
+    """
+    resultado = getattr(serie.astype(object).str, metodo)()
+    return resultado.astype(serie.dtype)
+
+
+def eliminar_acentos_series(serie: pd.Series) -> pd.Series:
+    """
+    Elimina acentos de una columna completa de texto.
+
+    Args:
+        serie: Columna con posibles acentos
+
+    Returns:
+        pd.Series: Columna sin acentos (los nulos se conservan)
+    """
+    resultado = serie.str.translate(_ACCENT_MAP)
+
+    pendientes = resultado.str.contains(_NO_ASCII_RE, na=False)
+    if pendientes.any():
+        resultado[pendientes] = resultado[pendientes].map(_quitar_combinantes)
+
+    return resultado
+
+
+def normalizar_texto_series(serie: pd.Series) -> pd.Series:
+    """
+    Versión vectorizada de normalizar_texto: strip + Title Case.
+
+    Args:
+        serie: Columna de texto a normalizar
+
+    Returns:
+        pd.Series: Columna normalizada
+    """
+    return _cambiar_mayusculas(serie.str.strip(), "title")
+
+
+def normalizar_texto_mayusculas_series(serie: pd.Series) -> pd.Series:
+    """
+    Versión vectorizada de normalizar_texto_mayusculas.
+
+    Args:
+        serie: Columna de texto a normalizar
+
+    Returns:
+        pd.Series: Columna en mayúsculas y sin acentos
+    """
+    return eliminar_acentos_series(_cambiar_mayusculas(serie.str.strip(), "upper"))
+
+
+def normalizar_nombre_series(serie: pd.Series) -> pd.Series:
+    """
+    Normaliza una columna de nombres en una sola función: strip + Title Case
+    y eliminación de acentos.
+
+    Args:
+        serie: Columna de nombres a normalizar
+
+    Returns:
+        pd.Series: Nombres normalizados y sin acentos
+    """
+    return eliminar_acentos_series(_cambiar_mayusculas(serie.str.strip(), "title"))
+
+
+def normalizar_dni_series(serie: pd.Series) -> pd.Series:
+    """
+    Versión vectorizada de normalizar_dni.
+
+    Args:
+        serie: Columna de DNIs a normalizar
+
+    Returns:
+        pd.Series: DNIs sin espacios ni guiones y en mayúsculas
+    """
+    # Como en _solo_digitos_series, espacio y guion se quitan con reemplazos
+    # literales. Si el resultado es alfanumérico el strip inicial no cambia
+    # nada; el resto (otros espacios Unicode) se recalcula como normalizar_dni,
+    # que solo los recorta en los extremos
+    resultado = serie.str.replace(" ", "", regex=False).str.replace("-", "", regex=False)
+
+    pendientes = ~resultado.str.isalnum().fillna(True)
+    if pendientes.any():
+        resultado[pendientes] = (
+            serie[pendientes].str.strip().str.replace(_DNI_STRIP_RE, "", regex=True)
+        )
+
+    return _cambiar_mayusculas(resultado, "upper")
+
+
+def normalizar_correo_series(serie: pd.Series) -> pd.Series:
+    """
+    Versión vectorizada de normalizar_correo.
+
+    Args:
+        serie: Columna de correos a normalizar
+
+    Returns:
+        pd.Series: Correos en minúsculas
+    """
+    return _cambiar_mayusculas(serie.str.strip(), "lower")
+
+
+def _solo_digitos_series(serie: pd.Series) -> pd.Series:
+    """
+    Deja solo los dígitos de cada valor de una columna.
+
+    Los separadores habituales (espacio y guion) se quitan con reemplazos
+    literales; la expresión regular solo se aplica a los valores que aún
+    contienen algo que no es un dígito.
+
+    Args:
+        serie: Columna a limpiar
+
+    Returns:
+        pd.Series: Columna con solo dígitos (los nulos se conservan)
+    """
+    resultado = serie.str.replace(" ", "", regex=False).str.replace("-", "", regex=False)
+
+    pendientes = ~resultado.str.isdecimal().fillna(True)
+    if pendientes.any():
+        resultado[pendientes] = resultado[pendientes].str.replace(_NONDIGIT_RE, "", regex=True)
+
+    return resultado
+
+
+def normalizar_telefono_series(serie: pd.Series) -> pd.Series:
+    """
+    Versión vectorizada de normalizar_telefono.
+
+    Args:
+        serie: Columna de teléfonos a normalizar
+
+    Returns:
+        pd.Series: Teléfonos con solo dígitos
+    """
+    return _solo_digitos_series(serie)
+
+
+def normalizar_numero_tarjeta_series(serie: pd.Series) -> pd.Series:
+    """
+    Versión vectorizada de normalizar_numero_tarjeta.
+
+    Args:
+        serie: Columna de números de tarjeta a normalizar
+
+    Returns:
+        pd.Series: Números con solo dígitos
+    """
+    return _solo_digitos_series(serie)
+
+
+def normalizar_cvv_series(serie: pd.Series) -> pd.Series:
+    """
+    Versión vectorizada de normalizar_cvv.
+
+    Args:
+        serie: Columna de CVVs a normalizar
+
+    Returns:
+        pd.Series: CVVs con solo dígitos
+    """
+    return _solo_digitos_series(serie)
+
+
+def normalizar_fecha_exp_series(serie: pd.Series) -> pd.Series:
+    """
+    Normaliza una columna de fechas de expiración (solo elimina espacios).
+
+    Args:
+        serie: Columna de fechas de expiración
+
+    Returns:
+        pd.Series: Fechas sin espacios alrededor
+    """
+    return serie.str.strip()
+
+
 # =============================================================================
 # DICCIONARIOS DE NORMALIZADORES POR TIPO
 # =============================================================================
 
+# Cada normalizador recibe y devuelve una columna completa (pd.Series)
 CLIENTES_NORMALIZERS = {
-    "nombre": lambda x: eliminar_acentos(normalizar_texto(x)),
-    "apellido1": normalizar_texto_mayusculas,
-    "apellido2": normalizar_texto_mayusculas,
-    "dni": normalizar_dni,
-    "correo": normalizar_correo,
-    "telefono": normalizar_telefono,
+    "nombre": normalizar_nombre_series,
+    "apellido1": normalizar_texto_mayusculas_series,
+    "apellido2": normalizar_texto_mayusculas_series,
+    "dni": normalizar_dni_series,
+    "correo": normalizar_correo_series,
+    "telefono": normalizar_telefono_series,
 }
 
 TARJETAS_NORMALIZERS = {
-    "numero_tarjeta": normalizar_numero_tarjeta,
-    "cvv": normalizar_cvv,
-    "fecha_exp": lambda x: str(x).strip() if x else "",
+    "numero_tarjeta": normalizar_numero_tarjeta_series,
+    "cvv": normalizar_cvv_series,
+    "fecha_exp": normalizar_fecha_exp_series,
 }
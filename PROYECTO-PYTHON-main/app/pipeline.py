@@ -7,67 +7,91 @@ Implementa el pipeline completo de ETL para:
 - Tarjetas: Extracción, normalización, anonimización y carga
 """
 
+import multiprocessing
 import pandas as pd
 from pathlib import Path
 from datetime import datetime
-from typing import Optional, Tuple, List
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Optional, Tuple, List, Pattern
 from abc import ABC, abstractmethod
 
 try:
     from app import config
-    from app.logger import get_logger
-    from app.database import get_database
+    from app.logger import (
+        get_logger,
+        reenviar_logs_de_procesos,
+        usar_cola_en_proceso_hijo,
+    )
+    from app.database import CLIENTS_COLUMNS, TARJETAS_COLUMNS, get_database
     from app.validators import (
-        validar_dni,
-        validar_telefono,
-        validar_correo,
-        validar_fecha_expiracion,
-        validar_nombre,
+        validar_fecha_expiracion_series,
+        validar_clientes_batch,
+        limpiar_caches,
     )
     from app.normalizers import (
         CLIENTES_NORMALIZERS,
         TARJETAS_NORMALIZERS,
-        normalizar_columnas_dataframe,
-        limpiar_espacios_dataframe,
+        transformar_dataframe,
         eliminar_acentos,
     )
     from app.utils import (
-        hash_con_salt,
-        enmascarar_tarjeta,
+        hash_series,
+        enmascarar_tarjeta_series,
         extraer_fecha_archivo,
-        leer_csv_con_encoding,
+        leer_csv,
+        leer_csv_en_bloques,
+        leer_csv_por_bloques,
         detectar_archivos,
         guardar_csv,
         validar_campos_obligatorios,
     )
 except ImportError:
     import config
-    from logger import get_logger
-    from database import get_database
+    from logger import (
+        get_logger,
+        reenviar_logs_de_procesos,
+        usar_cola_en_proceso_hijo,
+    )
+    from database import CLIENTS_COLUMNS, TARJETAS_COLUMNS, get_database
     from validators import (
-        validar_dni,
-        validar_telefono,
-        validar_correo,
-        validar_fecha_expiracion,
-        validar_nombre,
+        validar_fecha_expiracion_series,
+        validar_clientes_batch,
+        limpiar_caches,
     )
     from normalizers import (
         CLIENTES_NORMALIZERS,
         TARJETAS_NORMALIZERS,
-        normalizar_columnas_dataframe,
-        limpiar_espacios_dataframe,
+        transformar_dataframe,
         eliminar_acentos,
     )
     from utils import (
-        hash_con_salt,
-        enmascarar_tarjeta,
+        hash_series,
+        enmascarar_tarjeta_series,
         extraer_fecha_archivo,
-        leer_csv_con_encoding,
+        leer_csv,
+        leer_csv_en_bloques,
+        leer_csv_por_bloques,
         detectar_archivos,
         guardar_csv,
         validar_campos_obligatorios,
     )
 
+# Copy-on-Write (siempre activo desde pandas 3): los subconjuntos por máscara
+# se pueden modificar sin copiarlos antes
+if int(pd.__version__.split(".")[0]) < 3:
+    pd.set_option("mode.copy_on_write", True)
+
+# Columnas que nunca llegan a los CSV de salida
+_COLUMNAS_INTERNAS_CLIENTES = frozenset(
+    {"dni_valido", "telefono_valido", "correo_valido", "motivo_rechazo"}
+)
+_COLUMNAS_SENSIBLES_TARJETAS = frozenset(
+    {"numero_tarjeta", "numero_tarjeta_limpio", "cvv", "cvv_limpio"}
+)
+_COLUMNAS_INTERNAS_TARJETAS = frozenset(
+    {"fecha_exp_valida", "motivo_rechazo"}
+)
+
 
 class PipelineBase(ABC):
     """
@@ -75,13 +99,13 @@ class PipelineBase(ABC):
     Define la estructura común de todos los pipelines.
     """
 
-    def __init__(self, nombre: str, pattern: str, campos_obligatorios: List[str]):
+    def __init__(self, nombre: str, pattern: Pattern, campos_obligatorios: List[str]):
         """
         Inicializa el pipeline.
 
         Args:
             nombre: Nombre del pipeline (para logging)
-            pattern: Patrón regex para detectar archivos
+            pattern: Patrón regex precompilado para detectar archivos
             campos_obligatorios: Lista de campos requeridos
         """
         self.nombre = nombre
@@ -94,6 +118,8 @@ class PipelineBase(ABC):
             "filas_rechazadas": 0,
             "archivos_procesados": 0,
         }
+        # Archivos de salida ya escritos para el archivo en curso
+        self._salidas = set()
 
     def ejecutar(self, input_dir: Optional[Path] = None) -> dict:
         """
@@ -106,7 +132,7 @@ class PipelineBase(ABC):
             dict: Estadísticas de la ejecución
         """
         self.logger.info("=" * 80)
-        self.logger.info(f"INICIANDO PIPELINE: {self.nombre.upper()}")
+        self.logger.info("INICIANDO PIPELINE: %s", self.nombre.upper())
         self.logger.info("=" * 80)
 
         inicio = datetime.now()
@@ -126,8 +152,15 @@ class PipelineBase(ABC):
             self.logger.warning("No hay archivos para procesar")
             return self.stats
 
-        for archivo in archivos:
-            self._procesar_archivo(archivo)
+        grupos = self._agrupar_por_salida(archivos)
+        if config.PIPELINE_WORKERS > 1 and len(grupos) > 1:
+            self._procesar_en_paralelo(grupos)
+        else:
+            for archivo in archivos:
+                self._procesar_archivo(archivo)
+
+        # Los validadores escalares no conservan datos entre ejecuciones
+        limpiar_caches()
 
         fin = datetime.now()
         duracion = (fin - inicio).total_seconds()
@@ -135,6 +168,56 @@ class PipelineBase(ABC):
         self._mostrar_resumen(duracion)
         return self.stats
 
+    def _agrupar_por_salida(self, archivos: List[Path]) -> List[List[Path]]:
+        """
+        Agrupa los archivos que escriben la misma salida (misma fecha).
+
+        Los grupos son independientes entre sí y pueden ir a procesos
+        distintos; dentro de cada grupo se conserva el orden original, ya que
+        sus archivos escriben los mismos ficheros de salida.
+
+        Args:
+            archivos: Archivos a procesar
+
+        Returns:
+            List[List[Path]]: Grupos de archivos en orden de aparición
+        """
+        grupos = {}
+        for archivo in archivos:
+            fecha = extraer_fecha_archivo(archivo.name) or datetime.now().strftime("%Y-%m-%d")
+            grupos.setdefault(fecha, []).append(archivo)
+        return list(grupos.values())
+
+    def _procesar_en_paralelo(self, grupos: List[List[Path]]):
+        """
+        Procesa cada grupo de archivos en un proceso independiente y acumula
+        las estadísticas devueltas. Los procesos se crean con "spawn", por lo
+        que los scripts que lancen el pipeline deben proteger su punto de
+        entrada con ``if __name__ == "__main__":`` (como run.py).
+
+        Args:
+            grupos: Grupos de archivos (ver _agrupar_por_salida)
+        """
+        workers = min(config.PIPELINE_WORKERS, len(grupos))
+        total = sum(len(grupo) for grupo in grupos)
+        self.logger.info("Procesando %s archivos en %s procesos", total, workers)
+
+        # spawn: el proceso padre tiene hilos activos (p. ej. el volcado de logs).
+        # Los hijos no escriben archivos de log: envían sus registros al padre
+        contexto = multiprocessing.get_context("spawn")
+        with reenviar_logs_de_procesos(contexto) as cola_logs:
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=contexto,
+                initializer=usar_cola_en_proceso_hijo,
+                initargs=(cola_logs,),
+            ) as executor:
+                for stats in executor.map(
+                    _procesar_archivos_en_proceso, [type(self)] * len(grupos), grupos
+                ):
+                    for clave, valor in stats.items():
+                        self.stats[clave] += valor
+
     def _procesar_archivo(self, archivo: Path):
         """
         Procesa un archivo individual.
@@ -143,22 +226,36 @@ class PipelineBase(ABC):
             archivo: Ruta al archivo a procesar
         """
         self.logger.info("-" * 60)
-        self.logger.info(f"Procesando: {archivo.name}")
+        self.logger.info("Procesando: %s", archivo.name)
         self.logger.info("-" * 60)
 
-        # Leer
-        df = leer_csv_con_encoding(archivo)
-        if df is None or df.empty:
-            self.logger.warning(f"No se pudo leer o está vacío: {archivo.name}")
+        self._salidas = set()
+        filas_leidas = 0
+
+        # Leer por bloques (un único bloque si el archivo es pequeño)
+        for df in leer_csv_por_bloques(archivo):
+            if df.empty:
+                continue
+            filas_leidas += len(df)
+            self._procesar_bloque(df, archivo)
+
+        if filas_leidas == 0:
+            self.logger.warning("No se pudo leer o está vacío: %s", archivo.name)
             return
 
-        self.stats["filas_leidas"] += len(df)
+        self.stats["archivos_procesados"] += 1
+
+    def _procesar_bloque(self, df: pd.DataFrame, archivo: Path):
+        """
+        Transforma un bloque de filas y guarda sus resultados.
 
-        # Limpiar y normalizar columnas
-        df = limpiar_espacios_dataframe(df)
-        df = normalizar_columnas_dataframe(df)
+        Args:
+            df: Bloque de filas leído del archivo
+            archivo: Ruta al archivo de origen
+        """
+        self.stats["filas_leidas"] += len(df)
 
-        # Normalizar datos específicos
+        # Limpiar columnas y normalizar datos específicos (una sola pasada)
         df = self._normalizar_datos(df)
 
         # Validar datos
@@ -175,11 +272,22 @@ class PipelineBase(ABC):
         self._guardar_resultados(df_valido, df_rechazado, archivo)
 
         self.stats["filas_procesadas"] += len(df_valido)
-        self.stats["archivos_procesados"] += 1
+
+    def _guardar_csv(self, df: pd.DataFrame, filepath: Path):
+        """
+        Guarda un bloque de resultados: el primero crea el archivo y los
+        siguientes se añaden al final.
+
+        Args:
+            df: DataFrame a guardar
+            filepath: Ruta del archivo destino
+        """
+        if guardar_csv(df, filepath, anexar=filepath in self._salidas):
+            self._salidas.add(filepath)
 
     @abstractmethod
     def _normalizar_datos(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Normaliza los datos específicos del tipo de archivo."""
+        """Limpia columnas y normaliza los datos específicos del tipo de archivo."""
         pass
 
     @abstractmethod
@@ -207,13 +315,13 @@ class PipelineBase(ABC):
             duracion: Tiempo de ejecución en segundos
         """
         self.logger.info("=" * 80)
-        self.logger.info(f"PIPELINE {self.nombre.upper()} COMPLETADO")
+        self.logger.info("PIPELINE %s COMPLETADO", self.nombre.upper())
         self.logger.info("=" * 80)
-        self.logger.info(f"Archivos procesados: {self.stats['archivos_procesados']}")
-        self.logger.info(f"Filas leídas: {self.stats['filas_leidas']}")
-        self.logger.info(f"Filas procesadas: {self.stats['filas_procesadas']}")
-        self.logger.info(f"Filas rechazadas: {self.stats['filas_rechazadas']}")
-        self.logger.info(f"Tiempo: {duracion:.2f} segundos")
+        self.logger.info("Archivos procesados: %s", self.stats["archivos_procesados"])
+        self.logger.info("Filas leídas: %s", self.stats["filas_leidas"])
+        self.logger.info("Filas procesadas: %s", self.stats["filas_procesadas"])
+        self.logger.info("Filas rechazadas: %s", self.stats["filas_rechazadas"])
+        self.logger.info("Tiempo: %.2f segundos", duracion)
         self.logger.info("=" * 80)
 
 
@@ -225,7 +333,7 @@ class PipelineClientes(PipelineBase):
     def __init__(self):
         super().__init__(
             nombre="clientes",
-            pattern=config.CLIENTES_PATTERN,
+            pattern=config.CLIENTES_RE,
             campos_obligatorios=config.REQUIRED_FIELDS["clientes"],
         )
 
@@ -233,12 +341,10 @@ class PipelineClientes(PipelineBase):
         """Normaliza datos de clientes."""
         self.logger.info("Normalizando datos de clientes...")
 
-        for columna, normalizador in CLIENTES_NORMALIZERS.items():
+        df = transformar_dataframe(df, CLIENTES_NORMALIZERS)
+        for columna in CLIENTES_NORMALIZERS:
             if columna in df.columns:
-                df[columna] = df[columna].apply(
-                    lambda x: normalizador(x) if pd.notna(x) and x != "" else x
-                )
-                self.logger.info(f"  ✓ {columna} normalizado")
+                self.logger.info("  ✓ %s normalizado", columna)
 
         return df
 
@@ -246,24 +352,28 @@ class PipelineClientes(PipelineBase):
         """Valida datos de clientes."""
         self.logger.info("Validando datos de clientes...")
 
-        if "dni" in df.columns:
-            df["dni_valido"] = df["dni"].apply(lambda x: validar_dni(x) if x else False)
+        # Las tres validaciones se resuelven en un único recorrido de las filas
+        dni_ok, telefono_ok, correo_ok = validar_clientes_batch(
+            *(
+                df[col].to_numpy(dtype=object) if col in df.columns else None
+                for col in ("dni", "telefono", "correo")
+            )
+        )
+
+        if dni_ok is not None:
+            df["dni_valido"] = dni_ok
             validos = df["dni_valido"].sum()
-            self.logger.info(f"  ✓ DNI: {validos}/{len(df)} válidos")
+            self.logger.info("  ✓ DNI: %s/%s válidos", validos, len(df))
 
-        if "telefono" in df.columns:
-            df["telefono_valido"] = df["telefono"].apply(
-                lambda x: validar_telefono(x) if x else False
-            )
+        if telefono_ok is not None:
+            df["telefono_valido"] = telefono_ok
             validos = df["telefono_valido"].sum()
-            self.logger.info(f"  ✓ Teléfono: {validos}/{len(df)} válidos")
+            self.logger.info("  ✓ Teléfono: %s/%s válidos", validos, len(df))
 
-        if "correo" in df.columns:
-            df["correo_valido"] = df["correo"].apply(
-                lambda x: validar_correo(x) if x else False
-            )
+        if correo_ok is not None:
+            df["correo_valido"] = correo_ok
             validos = df["correo_valido"].sum()
-            self.logger.info(f"  ✓ Correo: {validos}/{len(df)} válidos")
+            self.logger.info("  ✓ Correo: %s/%s válidos", validos, len(df))
 
         return df
 
@@ -272,7 +382,7 @@ class PipelineClientes(PipelineBase):
         self.logger.info("Anonimizando datos sensibles...")
 
         if "dni" in df.columns:
-            df["dni_hash"] = df["dni"].apply(hash_con_salt)
+            df["dni_hash"] = hash_series(df["dni"])
             self.logger.info("  ✓ DNI hasheado")
 
         return df
@@ -285,17 +395,16 @@ class PipelineClientes(PipelineBase):
             "%Y-%m-%d"
         )
 
-        # Columnas a excluir del CSV final
-        cols_excluir = ["dni_valido", "telefono_valido", "correo_valido", "motivo_rechazo"]
-
         if not df_valido.empty:
-            cols_exportar = [c for c in df_valido.columns if c not in cols_excluir]
+            cols_exportar = [
+                c for c in df_valido.columns if c not in _COLUMNAS_INTERNAS_CLIENTES
+            ]
             archivo_salida = config.OUTPUT_DIR / f"Clientes-{fecha}.cleaned.csv"
-            guardar_csv(df_valido[cols_exportar], archivo_salida)
+            self._guardar_csv(df_valido[cols_exportar], archivo_salida)
 
         if not df_rechazado.empty:
             archivo_errores = config.ERRORS_DIR / f"Clientes-{fecha}.rejected.csv"
-            guardar_csv(df_rechazado, archivo_errores)
+            self._guardar_csv(df_rechazado, archivo_errores)
 
 
 class PipelineTarjetas(PipelineBase):
@@ -306,7 +415,7 @@ class PipelineTarjetas(PipelineBase):
     def __init__(self):
         super().__init__(
             nombre="tarjetas",
-            pattern=config.TARJETAS_PATTERN,
+            pattern=config.TARJETAS_RE,
             campos_obligatorios=config.REQUIRED_FIELDS["tarjetas"],
         )
 
@@ -314,12 +423,10 @@ class PipelineTarjetas(PipelineBase):
         """Normaliza datos de tarjetas."""
         self.logger.info("Normalizando datos de tarjetas...")
 
-        for columna, normalizador in TARJETAS_NORMALIZERS.items():
+        df = transformar_dataframe(df, TARJETAS_NORMALIZERS, sufijo="_limpio")
+        for columna in TARJETAS_NORMALIZERS:
             if columna in df.columns:
-                df[f"{columna}_limpio"] = df[columna].apply(
-                    lambda x: normalizador(x) if pd.notna(x) and x != "" else x
-                )
-                self.logger.info(f"  ✓ {columna} normalizado")
+                self.logger.info("  ✓ %s normalizado", columna)
 
         return df
 
@@ -328,11 +435,9 @@ class PipelineTarjetas(PipelineBase):
         self.logger.info("Validando datos de tarjetas...")
 
         if "fecha_exp" in df.columns:
-            df["fecha_exp_valida"] = df["fecha_exp"].apply(
-                lambda x: validar_fecha_expiracion(x) if x else False
-            )
+            df["fecha_exp_valida"] = validar_fecha_expiracion_series(df["fecha_exp"])
             validos = df["fecha_exp_valida"].sum()
-            self.logger.info(f"  ✓ Fecha expiración: {validos}/{len(df)} válidos")
+            self.logger.info("  ✓ Fecha expiración: %s/%s válidos", validos, len(df))
 
         return df
 
@@ -344,12 +449,12 @@ class PipelineTarjetas(PipelineBase):
         col_cvv = "cvv_limpio" if "cvv_limpio" in df.columns else "cvv"
 
         if col_tarjeta in df.columns:
-            df["numero_tarjeta_masked"] = df[col_tarjeta].apply(enmascarar_tarjeta)
-            df["numero_tarjeta_hash"] = df[col_tarjeta].apply(hash_con_salt)
+            df["numero_tarjeta_masked"] = enmascarar_tarjeta_series(df[col_tarjeta])
+            df["numero_tarjeta_hash"] = hash_series(df[col_tarjeta])
             self.logger.info("  ✓ Número de tarjeta enmascarado y hasheado")
 
         if col_cvv in df.columns:
-            df["cvv_hash"] = df[col_cvv].apply(hash_con_salt)
+            df["cvv_hash"] = hash_series(df[col_cvv])
             self.logger.info("  ✓ CVV hasheado")
 
         return df
@@ -362,28 +467,39 @@ class PipelineTarjetas(PipelineBase):
             "%Y-%m-%d"
         )
 
-        # Columnas sensibles a excluir SIEMPRE
-        cols_sensibles = [
-            "numero_tarjeta",
-            "numero_tarjeta_limpio",
-            "cvv",
-            "cvv_limpio",
-        ]
-        cols_internas = ["fecha_exp_valida", "motivo_rechazo"]
-
         if not df_valido.empty:
+            # Las columnas sensibles se excluyen SIEMPRE
             cols_exportar = [
-                c for c in df_valido.columns if c not in cols_sensibles + cols_internas
+                c
+                for c in df_valido.columns
+                if c not in _COLUMNAS_SENSIBLES_TARJETAS and c not in _COLUMNAS_INTERNAS_TARJETAS
             ]
             archivo_salida = config.OUTPUT_DIR / f"Tarjetas-{fecha}.cleaned.csv"
-            guardar_csv(df_valido[cols_exportar], archivo_salida)
+            self._guardar_csv(df_valido[cols_exportar], archivo_salida)
 
         if not df_rechazado.empty:
             cols_exportar_rechazadas = [
-                c for c in df_rechazado.columns if c not in cols_sensibles
+                c for c in df_rechazado.columns if c not in _COLUMNAS_SENSIBLES_TARJETAS
             ]
             archivo_errores = config.ERRORS_DIR / f"Tarjetas-{fecha}.rejected.csv"
-            guardar_csv(df_rechazado[cols_exportar_rechazadas], archivo_errores)
+            self._guardar_csv(df_rechazado[cols_exportar_rechazadas], archivo_errores)
+
+
+def _procesar_archivos_en_proceso(clase_pipeline: type, archivos: List[Path]) -> dict:
+    """
+    Procesa archivos en un proceso hijo con una instancia nueva del pipeline.
+
+    Args:
+        clase_pipeline: Clase del pipeline (PipelineClientes o PipelineTarjetas)
+        archivos: Rutas de los archivos a procesar, en orden
+
+    Returns:
+        dict: Estadísticas acumuladas de los archivos
+    """
+    pipeline = clase_pipeline()
+    for archivo in archivos:
+        pipeline._procesar_archivo(archivo)
+    return pipeline.stats
 
 
 class ETLOrchestrator:
@@ -396,12 +512,13 @@ class ETLOrchestrator:
         self.logger = get_logger("etl.orchestrator")
         self.db = get_database()
 
-    def ejecutar_completo(self, cargar_a_bd: bool = True) -> dict:
+    def ejecutar_completo(self, cargar_a_bd: bool = True, paralelo: bool = False) -> dict:
         """
         Ejecuta el proceso ETL completo.
 
         Args:
             cargar_a_bd: Si True, carga los datos procesados a la base de datos
+            paralelo: Si True, procesa clientes y tarjetas en hilos simultáneos
 
         Returns:
             dict: Estadísticas de la ejecución
@@ -413,15 +530,22 @@ class ETLOrchestrator:
         inicio = datetime.now()
         resultados = {"clientes": {}, "tarjetas": {}, "bd": {}}
 
-        # Pipeline de Clientes
-        self.logger.info("\n[1/3] Procesando Clientes...")
-        pipeline_clientes = PipelineClientes()
-        resultados["clientes"] = pipeline_clientes.ejecutar()
+        if paralelo:
+            # Los pipelines son independientes; la carga a BD espera a ambos
+            self.logger.info("\n[1-2/3] Procesando Clientes y Tarjetas en paralelo...")
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                futuro_clientes = executor.submit(ejecutar_pipeline_clientes)
+                futuro_tarjetas = executor.submit(ejecutar_pipeline_tarjetas)
+                resultados["clientes"] = futuro_clientes.result()
+                resultados["tarjetas"] = futuro_tarjetas.result()
+        else:
+            # Pipeline de Clientes
+            self.logger.info("\n[1/3] Procesando Clientes...")
+            resultados["clientes"] = ejecutar_pipeline_clientes()
 
-        # Pipeline de Tarjetas
-        self.logger.info("\n[2/3] Procesando Tarjetas...")
-        pipeline_tarjetas = PipelineTarjetas()
-        resultados["tarjetas"] = pipeline_tarjetas.ejecutar()
+            # Pipeline de Tarjetas
+            self.logger.info("\n[2/3] Procesando Tarjetas...")
+            resultados["tarjetas"] = ejecutar_pipeline_tarjetas()
 
         # Carga a Base de Datos
         if cargar_a_bd:
@@ -433,7 +557,7 @@ class ETLOrchestrator:
 
         self.logger.info("\n" + "=" * 80)
         self.logger.info("PROCESO ETL COMPLETADO")
-        self.logger.info(f"Tiempo total: {duracion:.2f} segundos")
+        self.logger.info("Tiempo total: %.2f segundos", duracion)
         self.logger.info("=" * 80)
 
         return resultados
@@ -448,6 +572,15 @@ class ETLOrchestrator:
         stats = {"clientes_insertados": 0, "tarjetas_insertadas": 0, "errores": []}
 
         try:
+            # Buscar archivos procesados
+            archivos_clientes = list(config.OUTPUT_DIR.glob("Clientes-*.cleaned.csv"))
+            archivos_tarjetas = list(config.OUTPUT_DIR.glob("Tarjetas-*.cleaned.csv"))
+
+            # Sin archivos no hay nada que cargar: no se abre conexión
+            if not archivos_clientes and not archivos_tarjetas:
+                self.logger.info("  ✓ No hay archivos procesados para cargar")
+                return stats
+
             # Verificar conexión
             if not self.db.test_connection():
                 stats["errores"].append("No se pudo conectar a la base de datos")
@@ -456,38 +589,54 @@ class ETLOrchestrator:
             # Crear tablas si no existen
             self.db.create_tables()
 
-            # Buscar archivos procesados
-            archivos_clientes = list(config.OUTPUT_DIR.glob("Clientes-*.cleaned.csv"))
-            archivos_tarjetas = list(config.OUTPUT_DIR.glob("Tarjetas-*.cleaned.csv"))
-
-            # Cargar clientes
+            # Cargar clientes (por bloques en archivos grandes: la memoria no
+            # crece con el tamaño del archivo y la inserción empieza antes).
+            # Con BULK_LOAD_MODE cada carga retira y recrea UNIQUE(dni), así
+            # que el archivo se carga entero para reconstruir el índice una vez
+            opciones_clientes = dict(
+                sep=config.CSV_SEPARATOR,
+                dtype=str,
+                encoding=config.FILE_ENCODING,
+                usecols=lambda c: c in CLIENTS_COLUMNS,
+            )
             for archivo in archivos_clientes:
-                df = pd.read_csv(
-                    archivo, sep=config.CSV_SEPARATOR, dtype=str, encoding=config.FILE_ENCODING
-                )
-                if not df.empty:
-                    try:
-                        stats["clientes_insertados"] += self.db.insert_clients(df)
-                    except Exception as e:
-                        stats["errores"].append(f"Error en {archivo.name}: {e}")
+                try:
+                    if config.BULK_LOAD_MODE:
+                        bloques = [leer_csv(archivo, **opciones_clientes)]
+                    else:
+                        bloques = leer_csv_en_bloques(archivo, **opciones_clientes)
+                    for df in bloques:
+                        if not df.empty:
+                            stats["clientes_insertados"] += self.db.insert_clients(df)
+                except Exception as e:
+                    stats["errores"].append(f"Error en {archivo.name}: {e}")
 
             # Cargar tarjetas (solo si hay clientes cargados)
             if stats["clientes_insertados"] > 0:
+                # Los códigos de cliente se consultan una sola vez para todos
+                # los bloques de tarjetas, no una vez por bloque
+                clientes_existentes = self.db.get_existing_clients()
                 for archivo in archivos_tarjetas:
-                    df = pd.read_csv(
-                        archivo, sep=config.CSV_SEPARATOR, dtype=str, encoding=config.FILE_ENCODING
-                    )
-                    if not df.empty:
-                        try:
-                            stats["tarjetas_insertadas"] += self.db.insert_tarjetas(df)
-                        except Exception as e:
-                            stats["errores"].append(f"Error en {archivo.name}: {e}")
-
-            self.logger.info(f"  ✓ Clientes insertados: {stats['clientes_insertados']}")
-            self.logger.info(f"  ✓ Tarjetas insertadas: {stats['tarjetas_insertadas']}")
+                    try:
+                        for df in leer_csv_en_bloques(
+                            archivo,
+                            sep=config.CSV_SEPARATOR,
+                            dtype=str,
+                            encoding=config.FILE_ENCODING,
+                            usecols=lambda c: c in TARJETAS_COLUMNS,
+                        ):
+                            if not df.empty:
+                                stats["tarjetas_insertadas"] += self.db.insert_tarjetas(
+                                    df, clientes_existentes
+                                )
+                    except Exception as e:
+                        stats["errores"].append(f"Error en {archivo.name}: {e}")
+
+            self.logger.info("  ✓ Clientes insertados: %s", stats["clientes_insertados"])
+            self.logger.info("  ✓ Tarjetas insertadas: %s", stats["tarjetas_insertadas"])
 
         except Exception as e:
-            self.logger.error(f"Error en carga a BD: {e}")
+            self.logger.error("Error en carga a BD: %s", e)
             stats["errores"].append(str(e))
 
         return stats
@@ -510,18 +659,19 @@ def ejecutar_pipeline_tarjetas() -> dict:
     return pipeline.ejecutar()
 
 
-def ejecutar_etl_completo(cargar_a_bd: bool = True) -> dict:
+def ejecutar_etl_completo(cargar_a_bd: bool = True, paralelo: bool = False) -> dict:
     """
     Ejecuta el proceso ETL completo.
 
     Args:
         cargar_a_bd: Si True, carga a base de datos
+        paralelo: Si True, procesa clientes y tarjetas simultáneamente
 
     Returns:
         dict: Resultados de la ejecución
     """
     orchestrator = ETLOrchestrator()
-    return orchestrator.ejecutar_completo(cargar_a_bd)
+    return orchestrator.ejecutar_completo(cargar_a_bd, paralelo)
 
 
 if __name__ == "__main__":
@@ -5,16 +5,22 @@ Módulo de Utilidades
 Funciones auxiliares para el procesamiento ETL:
 - Hashing de datos sensibles
 - Enmascaramiento de tarjetas
-- Lectura de archivos CSV
+- Lectura de archivos CSV (completa o por bloques)
 - Extracción de fechas
 """
 
+import os
 import re
 import io
+import mmap
+import codecs
 import hashlib
+import importlib.util
+from itertools import islice
 from pathlib import Path
-from typing import Optional, List, Tuple
+from typing import Iterator, Optional, List, Tuple, Union, Pattern
 
+import numpy as np
 import pandas as pd
 
 try:
@@ -26,22 +32,79 @@ except ImportError:
 
 logger = get_logger("utils")
 
+# pyarrow es opcional: sin él se lee siempre con el motor C de pandas
+_PYARROW_DISPONIBLE = importlib.util.find_spec("pyarrow") is not None
+
+NA_VALUES = ["", "NULL", "null", "None", "NA"]
+
+_NO_DIGITO_RE = re.compile(r"\D")
+_GRUPO_4_RE = re.compile(r"(.{4})(?=.)")
+_FECHA_ARCHIVO_RE = re.compile(r"(\d{4}-\d{2}-\d{2})")
+_PREFIJO_LITERAL_RE = re.compile(r"[A-Za-z0-9_-]*")
+
+# Filas que to_csv serializa por escritura; acota el buffer intermedio
+_FILAS_POR_ESCRITURA = 50_000
+
+# Salt codificado una sola vez y estado del hash que ya lo ha absorbido;
+# cada hash parte de una copia de ese estado en lugar de rehashear el salt
+_SALT_BYTES = config.HASH_SALT.encode("utf-8")
+
+if config.HASH_ALGO == "blake2b":
+    # digest_size=32: 64 caracteres hexadecimales, como SHA-256
+    _BASE_HASHER = hashlib.blake2b(_SALT_BYTES, digest_size=32)
+elif config.HASH_ALGO == "sha256":
+    _BASE_HASHER = hashlib.sha256(_SALT_BYTES)
+else:
+    raise ValueError(f"ETL_HASH_ALGO no soportado: {config.HASH_ALGO}")
+
 
 def hash_con_salt(valor: str) -> Optional[str]:
     """
-    Genera un hash SHA-256 de un valor con salt.
+    Genera el hash con salt (algoritmo de HASH_ALGO) de un valor.
 
     Args:
         valor: Valor a hashear
 
     Returns:
-        str: Hash del valor o None si el valor está vacío
+        str: Hash del valor o None si el valor es nulo (None/NaN) o vacío
     """
-    if not valor:
+    if pd.isna(valor) or not valor:
         return None
 
-    texto_completo = f"{config.HASH_SALT}{str(valor)}"
-    return hashlib.sha256(texto_completo.encode("utf-8")).hexdigest()
+    hasher = _BASE_HASHER.copy()
+    hasher.update(str(valor).encode("utf-8"))
+    return hasher.hexdigest()
+
+
+def hash_series(serie: pd.Series) -> pd.Series:
+    """
+    Genera el hash con salt (algoritmo de HASH_ALGO) de una columna completa.
+
+    Equivale a aplicar hash_con_salt fila a fila a una columna de texto
+    (nulos y cadenas vacías dan None), pero recorre la columna una sola vez
+    sin pasar por Series.apply. Cada valor distinto se hashea una única vez
+    (columnas como el CVV repiten mucho sus valores).
+
+    Args:
+        serie: Columna con los valores a hashear
+
+    Returns:
+        pd.Series: Hashes en hexadecimal (None para valores nulos o vacíos)
+    """
+    copiar = _BASE_HASHER.copy
+
+    mascara = serie.notna() & (serie != "")
+    codigos, unicos = pd.factorize(serie[mascara].astype(str).to_numpy(dtype=object))
+
+    hashes = np.empty(len(unicos), dtype=object)
+    for i, valor in enumerate(unicos):
+        hasher = copiar()
+        hasher.update(valor.encode("utf-8"))
+        hashes[i] = hasher.hexdigest()
+
+    resultado = np.full(len(serie), None, dtype=object)
+    resultado[mascara.to_numpy(dtype=bool)] = hashes[codigos]
+    return pd.Series(resultado, index=serie.index, dtype=object)
 
 
 def enmascarar_tarjeta(numero_tarjeta: str) -> Optional[str]:
@@ -57,7 +120,7 @@ def enmascarar_tarjeta(numero_tarjeta: str) -> Optional[str]:
     if not numero_tarjeta:
         return None
 
-    digitos = "".join(filter(str.isdigit, str(numero_tarjeta)))
+    digitos = _NO_DIGITO_RE.sub("", str(numero_tarjeta))
 
     if len(digitos) < 4:
         return "X" * len(digitos)
@@ -70,6 +133,31 @@ def enmascarar_tarjeta(numero_tarjeta: str) -> Optional[str]:
     return "-".join(grupos)
 
 
+def enmascarar_tarjeta_series(serie: pd.Series) -> pd.Series:
+    """
+    Versión vectorizada de enmascarar_tarjeta para una columna completa.
+
+    Args:
+        serie: Columna con números de tarjeta
+
+    Returns:
+        pd.Series: Números enmascarados (ej: XXXX-XXXX-XXXX-1234); None para
+        valores nulos o vacíos
+    """
+    mascara = serie.notna() & (serie != "")
+    digitos = serie[mascara].astype(str).str.replace(_NO_DIGITO_RE, "", regex=True)
+    n = digitos.str.len()
+
+    # Con menos de 4 dígitos se ocultan todos
+    ocultos = n.where(n < 4, n - 4)
+    visibles = digitos.str.slice(-4).where(n >= 4, "")
+    enmascarado = pd.Series("X", index=digitos.index).str.repeat(ocultos) + visibles
+
+    resultado = pd.Series(None, index=serie.index, dtype=object)
+    resultado[mascara] = enmascarado.str.replace(_GRUPO_4_RE, r"\1-", regex=True)
+    return resultado
+
+
 def extraer_fecha_archivo(nombre_archivo: str) -> Optional[str]:
     """
     Extrae la fecha de un nombre de archivo.
@@ -80,11 +168,84 @@ def extraer_fecha_archivo(nombre_archivo: str) -> Optional[str]:
     Returns:
         str: Fecha extraída (ej: 2026-01-19) o None
     """
-    patron = r"(\d{4}-\d{2}-\d{2})"
-    match = re.search(patron, nombre_archivo)
+    match = _FECHA_ARCHIVO_RE.search(nombre_archivo)
     return match.group(1) if match else None
 
 
+def leer_csv(source, **kwargs) -> pd.DataFrame:
+    """
+    Lee un CSV con el motor configurado en CSV_ENGINE.
+
+    Si el motor pyarrow no está disponible o falla al parsear, se vuelve a
+    leer con el motor C de pandas, que es el que decide el resultado final
+    (incluidos los UnicodeDecodeError que usa la cascada de encodings).
+
+    Args:
+        source: Ruta o buffer del CSV
+        **kwargs: Argumentos para pd.read_csv
+
+    Returns:
+        DataFrame: Datos leídos
+    """
+    if config.CSV_ENGINE == "pyarrow" and _PYARROW_DISPONIBLE:
+        try:
+            return pd.read_csv(source, engine="pyarrow", **kwargs)
+        except Exception as e:
+            logger.debug("  Motor pyarrow no pudo leer el CSV (%s); se usa el motor C", e)
+            if hasattr(source, "seek"):
+                source.seek(0)
+
+    # Las rutas se leen mapeadas en memoria (solo lo admite el motor C)
+    if isinstance(source, (str, Path)):
+        kwargs.setdefault("memory_map", True)
+
+    return pd.read_csv(source, **kwargs)
+
+
+# Espacios que str.strip() elimina en un texto decodificado como Latin-1,
+# expresados como bytes (Latin-1 asigna un byte a cada carácter)
+_ESPACIOS_LATIN1 = rb" \t\x0b\x0c\r\x1c-\x1f\x85\xa0"
+_COMILLAS_LINEA_RE = re.compile(
+    rb"^[" + _ESPACIOS_LATIN1 + rb']*"*|"*[' + _ESPACIOS_LATIN1 + rb"]*$",
+    re.MULTILINE,
+)
+
+
+def _quitar_comillas_lineas(contenido) -> bytes:
+    """
+    Quita las comillas y espacios que envuelven cada línea de un CSV.
+
+    Equivale a ``line.strip().strip('"')`` línea a línea, pero en una sola
+    sustitución sobre los bytes, sin crear una cadena por línea.
+
+    Args:
+        contenido: Bytes del archivo (Latin-1 compatible) o un mmap de él
+
+    Returns:
+        bytes: Contenido con las líneas desenvueltas y saltos de línea en \\n
+    """
+    if contenido.find(b"\r") != -1:
+        contenido = bytes(contenido).replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+    return _COMILLAS_LINEA_RE.sub(b"", contenido)
+
+
+def _leer_sin_comillas(filepath: Path) -> bytes:
+    """
+    Lee un archivo con líneas entre comillas ya desenvueltas.
+
+    El archivo se mapea en memoria y la sustitución trabaja directamente
+    sobre las páginas mapeadas, sin copiarlo antes a un objeto bytes.
+
+    Args:
+        filepath: Ruta al archivo CSV
+
+    Returns:
+        bytes: Contenido con las líneas desenvueltas
+    """
+    with open(filepath, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        return _quitar_comillas_lineas(mm)
+
+
 def leer_csv_con_encoding(filepath: Path) -> Optional[pd.DataFrame]:
     """
     Lee un archivo CSV intentando diferentes encodings.
@@ -95,104 +256,341 @@ def leer_csv_con_encoding(filepath: Path) -> Optional[pd.DataFrame]:
     Returns:
         DataFrame: Datos del archivo o None si hay error
     """
-    logger.info(f"Leyendo archivo: {filepath.name}")
+    logger.info("Leyendo archivo: %s", filepath.name)
 
-    # Primero, detectar si el archivo tiene líneas con comillas
+    # Primero, detectar si el archivo tiene líneas con comillas (solo se
+    # mira la primera línea; el resto del archivo no se toca si no las hay)
     try:
-        with open(filepath, "r", encoding=config.FILE_ENCODING_FALLBACK) as f:
-            lines = f.readlines()
-
-        # Limpiar comillas que envuelven cada línea
-        if lines and lines[0].startswith('"') and lines[0].strip().endswith('"'):
-            cleaned_lines = [line.strip().strip('"') + "\n" for line in lines]
-            df = pd.read_csv(
-                io.StringIO("".join(cleaned_lines)),
+        if _tiene_lineas_con_comillas(filepath):
+            df = leer_csv(
+                io.BytesIO(_leer_sin_comillas(filepath)),
                 sep=config.CSV_SEPARATOR,
+                encoding=config.FILE_ENCODING_FALLBACK,
                 dtype=str,
-                na_values=["", "NULL", "null", "None", "NA"],
+                na_values=NA_VALUES,
             )
-            logger.info(f"  ✓ Leídas {len(df)} filas (formato con comillas)")
+            logger.info("  ✓ Leídas %s filas (formato con comillas)", len(df))
             return df
     except Exception:
         pass
 
     # Intentar con UTF-8
     try:
-        df = pd.read_csv(
+        df = leer_csv(
             filepath,
             sep=config.CSV_SEPARATOR,
             encoding=config.FILE_ENCODING,
             dtype=str,
-            na_values=["", "NULL", "null", "None", "NA"],
+            na_values=NA_VALUES,
         )
-        logger.info(f"  ✓ Leídas {len(df)} filas (encoding UTF-8)")
+        logger.info("  ✓ Leídas %s filas (encoding UTF-8)", len(df))
         return df
     except UnicodeDecodeError:
         pass
 
     # Intentar con Latin-1
     try:
-        df = pd.read_csv(
+        df = leer_csv(
             filepath,
             sep=config.CSV_SEPARATOR,
             encoding=config.FILE_ENCODING_FALLBACK,
             dtype=str,
-            na_values=["", "NULL", "null", "None", "NA"],
+            na_values=NA_VALUES,
         )
-        logger.info(f"  ✓ Leídas {len(df)} filas (encoding Latin-1)")
+        logger.info("  ✓ Leídas %s filas (encoding Latin-1)", len(df))
         return df
     except Exception as e:
-        logger.error(f"Error al leer {filepath.name}: {e}")
+        logger.error("Error al leer %s: %s", filepath.name, e)
         return None
 
 
-def detectar_archivos(directorio: Path, pattern: str) -> List[Path]:
+def _tiene_lineas_con_comillas(filepath: Path) -> bool:
+    """
+    Indica si la primera línea del archivo viene envuelta en comillas.
+
+    Args:
+        filepath: Ruta al archivo CSV
+
+    Returns:
+        bool: True si la línea empieza y termina con comillas
+    """
+    with open(filepath, "r", encoding=config.FILE_ENCODING_FALLBACK) as f:
+        primera = f.readline()
+    return primera.startswith('"') and primera.strip().endswith('"')
+
+
+def _es_utf8(filepath: Path) -> bool:
+    """
+    Comprueba si un archivo es UTF-8 válido sin cargarlo entero en memoria.
+
+    Args:
+        filepath: Ruta al archivo
+
+    Returns:
+        bool: True si todo el contenido decodifica como UTF-8
+    """
+    decoder = codecs.getincrementaldecoder(config.FILE_ENCODING)()
+    try:
+        with open(filepath, "rb") as f:
+            for bloque in iter(lambda: f.read(1 << 20), b""):
+                decoder.decode(bloque)
+        decoder.decode(b"", final=True)
+    except UnicodeDecodeError:
+        return False
+    return True
+
+
+def _bloques_con_comillas(filepath: Path, chunksize: int) -> Iterator[pd.DataFrame]:
+    """
+    Lee por bloques un CSV cuyas líneas vienen envueltas en comillas.
+
+    Cada bloque de líneas se desenvuelve con una sola sustitución sobre sus
+    bytes (_quitar_comillas_lineas), sin decodificar ni limpiar línea a línea.
+
+    Args:
+        filepath: Ruta al archivo CSV
+        chunksize: Filas por bloque
+
+    Yields:
+        DataFrame: Bloque de filas
+    """
+    with open(filepath, "rb") as f:
+        cabecera = f.readline().rstrip(b"\r\n") + b"\n"
+        while True:
+            lote = list(islice(f, chunksize))
+            if not lote:
+                break
+            # Un único join con la cabecera delante: sin copia intermedia del bloque
+            lote.insert(0, cabecera)
+            contenido = _quitar_comillas_lineas(b"".join(lote))
+            yield leer_csv(
+                io.BytesIO(contenido),
+                sep=config.CSV_SEPARATOR,
+                encoding=config.FILE_ENCODING_FALLBACK,
+                dtype=str,
+                na_values=NA_VALUES,
+            )
+
+
+def leer_csv_por_bloques(
+    filepath: Path, chunksize: Optional[int] = None
+) -> Iterator[pd.DataFrame]:
+    """
+    Lee un archivo CSV como una secuencia de bloques de filas.
+
+    Los archivos menores de CSV_STREAM_MIN_BYTES se leen enteros con
+    leer_csv_con_encoding (un único bloque); los mayores se recorren por
+    bloques de ``chunksize`` filas con el mismo criterio de formato y
+    encoding, de modo que la memoria no crece con el tamaño del archivo.
+
+    Args:
+        filepath: Ruta al archivo CSV
+        chunksize: Filas por bloque (por defecto CSV_CHUNKSIZE)
+
+    Yields:
+        DataFrame: Bloque de filas (nada si el archivo no se puede leer)
+    """
+    chunksize = chunksize or config.CSV_CHUNKSIZE
+
+    if filepath.stat().st_size < config.CSV_STREAM_MIN_BYTES:
+        df = leer_csv_con_encoding(filepath)
+        if df is not None:
+            yield df
+        return
+
+    logger.info("Leyendo archivo por bloques de %s filas: %s", chunksize, filepath.name)
+
+    try:
+        if _tiene_lineas_con_comillas(filepath):
+            formato = "formato con comillas"
+            bloques = _bloques_con_comillas(filepath, chunksize)
+        else:
+            utf8 = _es_utf8(filepath)
+            formato = "encoding UTF-8" if utf8 else "encoding Latin-1"
+            bloques = pd.read_csv(
+                filepath,
+                sep=config.CSV_SEPARATOR,
+                encoding=config.FILE_ENCODING if utf8 else config.FILE_ENCODING_FALLBACK,
+                dtype=str,
+                na_values=NA_VALUES,
+                chunksize=chunksize,
+                memory_map=True,
+            )
+
+        total = 0
+        for bloque in bloques:
+            total += len(bloque)
+            yield bloque
+        logger.info("  ✓ Leídas %s filas (%s)", total, formato)
+    except Exception as e:
+        logger.error("Error al leer %s: %s", filepath.name, e)
+
+
+def leer_csv_en_bloques(
+    filepath: Path, chunksize: Optional[int] = None, **kwargs
+) -> Iterator[pd.DataFrame]:
+    """
+    Lee por bloques un CSV ya limpio (formato y encoding conocidos).
+
+    Como leer_csv_por_bloques, los archivos menores de CSV_STREAM_MIN_BYTES
+    se leen enteros con leer_csv; los mayores se recorren por bloques de
+    ``chunksize`` filas con el motor C.
+
+    Args:
+        filepath: Ruta al archivo CSV
+        chunksize: Filas por bloque (por defecto CSV_CHUNKSIZE)
+        **kwargs: Argumentos para pd.read_csv
+
+    Yields:
+        DataFrame: Bloque de filas
+    """
+    if filepath.stat().st_size < config.CSV_STREAM_MIN_BYTES:
+        yield leer_csv(filepath, **kwargs)
+        return
+
+    with pd.read_csv(
+        filepath, chunksize=chunksize or config.CSV_CHUNKSIZE, memory_map=True, **kwargs
+    ) as bloques:
+        yield from bloques
+
+
+def _prefijo_literal(patron: Pattern) -> str:
+    """
+    Obtiene el prefijo literal de un patrón para descartar entradas sin regex.
+
+    Args:
+        patron: Patrón regex precompilado
+
+    Returns:
+        str: Prefijo literal (vacío si no se puede deducir con seguridad)
+    """
+    texto = patron.pattern
+    if "|" in texto or patron.flags & re.IGNORECASE:
+        return ""
+
+    prefijo = _PREFIJO_LITERAL_RE.match(texto).group()
+    # Si al prefijo le sigue un cuantificador, su último carácter es opcional
+    if texto[len(prefijo) : len(prefijo) + 1] in ("?", "*", "{"):
+        prefijo = prefijo[:-1]
+    return prefijo
+
+
+def detectar_archivos(directorio: Path, pattern: Union[str, Pattern]) -> List[Path]:
     """
     Detecta archivos que coinciden con un patrón en un directorio.
 
     Args:
         directorio: Directorio donde buscar
-        pattern: Patrón regex para filtrar archivos
+        pattern: Patrón regex (texto o precompilado) para filtrar archivos
 
     Returns:
         List[Path]: Lista de archivos encontrados
     """
     archivos_encontrados = []
+    patron = re.compile(pattern) if isinstance(pattern, str) else pattern
 
     if not directorio.exists():
-        logger.warning(f"El directorio {directorio} no existe")
+        logger.warning("El directorio %s no existe", directorio)
         return archivos_encontrados
 
-    for archivo in directorio.glob("*.csv"):
-        if re.match(pattern, archivo.name):
-            archivos_encontrados.append(archivo)
-            logger.info(f"  ✓ Archivo encontrado: {archivo.name}")
+    # os.scandir aprovecha el tipo de entrada que ya trae el listado y solo
+    # se crea un Path para los archivos que coinciden con el patrón
+    prefijo = _prefijo_literal(patron)
+    with os.scandir(directorio) as entradas:
+        for entrada in entradas:
+            nombre = entrada.name
+            if (
+                nombre.startswith(prefijo)
+                and nombre.endswith(".csv")
+                and patron.match(nombre)
+                and entrada.is_file()
+            ):
+                archivos_encontrados.append(Path(entrada.path))
+                logger.info("  ✓ Archivo encontrado: %s", nombre)
 
     if not archivos_encontrados:
-        logger.warning(f"No se encontraron archivos con patrón {pattern}")
+        logger.warning("No se encontraron archivos con patrón %s", patron.pattern)
 
     return archivos_encontrados
 
 
-def guardar_csv(df: pd.DataFrame, filepath: Path) -> bool:
+def _csv_con_pyarrow(df: pd.DataFrame) -> Optional[bytes]:
+    """
+    Serializa las filas de un DataFrame a CSV con el escritor de pyarrow.
+
+    Solo se usa cuando el resultado es idéntico al de DataFrame.to_csv:
+    columnas de texto, salida UTF-8 y ningún valor que necesite comillas.
+    En cualquier otro caso devuelve None y se escribe con pandas.
+
+    Args:
+        df: DataFrame a serializar
+
+    Returns:
+        bytes: Filas en CSV (sin cabecera) o None si no aplica
+    """
+    if config.CSV_ENGINE != "pyarrow" or not _PYARROW_DISPONIBLE:
+        return None
+    if config.FILE_ENCODING.lower().replace("-", "") != "utf8":
+        return None
+    if not all(pd.api.types.is_string_dtype(serie) for _, serie in df.items()):
+        return None
+
+    import pyarrow as pa
+    from pyarrow import csv as pa_csv
+
+    opciones = pa_csv.WriteOptions(
+        include_header=False,
+        delimiter=config.CSV_SEPARATOR,
+        quoting_style="none",
+    )
+    buffer = pa.BufferOutputStream()
+    try:
+        pa_csv.write_csv(pa.Table.from_pandas(df, preserve_index=False), buffer, write_options=opciones)
+    except (pa.ArrowInvalid, pa.ArrowTypeError) as e:
+        # Con quoting_style="none" pyarrow rechaza valores con separador,
+        # comillas o saltos de línea; to_csv los entrecomilla
+        logger.debug("  Escritura con pyarrow no aplicable (%s); se usa to_csv", e)
+        return None
+    return buffer.getvalue().to_pybytes()
+
+
+def guardar_csv(df: pd.DataFrame, filepath: Path, anexar: bool = False) -> bool:
     """
     Guarda un DataFrame en un archivo CSV.
 
     Args:
         df: DataFrame a guardar
         filepath: Ruta del archivo destino
+        anexar: Si True, añade las filas al final sin repetir la cabecera
 
     Returns:
         bool: True si se guardó correctamente
     """
     try:
-        df.to_csv(
-            filepath, sep=config.CSV_SEPARATOR, index=False, encoding=config.FILE_ENCODING
-        )
-        logger.info(f"  ✓ Guardado: {filepath.name} ({len(df)} filas)")
+        filas = _csv_con_pyarrow(df)
+        if filas is not None:
+            with open(filepath, "ab" if anexar else "wb") as f:
+                if not anexar:
+                    cabecera = df.iloc[0:0].to_csv(
+                        sep=config.CSV_SEPARATOR, index=False, lineterminator="\n"
+                    )
+                    f.write(cabecera.encode(config.FILE_ENCODING))
+                f.write(filas)
+        else:
+            df.to_csv(
+                filepath,
+                sep=config.CSV_SEPARATOR,
+                index=False,
+                encoding=config.FILE_ENCODING,
+                mode="a" if anexar else "w",
+                header=not anexar,
+                lineterminator="\n",
+                chunksize=_FILAS_POR_ESCRITURA,
+            )
+        logger.info("  ✓ Guardado: %s (%s filas)", filepath.name, len(df))
         return True
     except Exception as e:
-        logger.error(f"Error al guardar {filepath.name}: {e}")
+        logger.error("Error al guardar %s: %s", filepath.name, e)
         return False
 
 
@@ -202,6 +600,8 @@ def validar_campos_obligatorios(
     """
     Separa filas válidas de inválidas según campos obligatorios.
 
+    Solo las filas rechazadas reciben la columna motivo_rechazo.
+
     Args:
         df: DataFrame a validar
         campos: Lista de campos obligatorios
@@ -209,27 +609,39 @@ def validar_campos_obligatorios(
     Returns:
         Tuple[DataFrame, DataFrame]: (filas válidas, filas rechazadas)
     """
-    mascara_valida = pd.Series([True] * len(df))
-    motivos_rechazo = [""] * len(df)
-
-    for campo in campos:
-        if campo in df.columns:
-            mascara_campo = df[campo].notna() & (df[campo] != "")
-            mascara_invalida = ~mascara_campo
-
-            if mascara_invalida.any():
-                for idx in df[mascara_invalida].index:
-                    if motivos_rechazo[idx]:
-                        motivos_rechazo[idx] += f"; {campo} vacío"
-                    else:
-                        motivos_rechazo[idx] = f"{campo} vacío"
-                mascara_valida &= mascara_campo
-
-    df["motivo_rechazo"] = motivos_rechazo
-    df_valido = df[mascara_valida].copy()
-    df_rechazado = df[~mascara_valida].copy()
+    presentes = [campo for campo in campos if campo in df.columns]
+
+    # Matriz (fila, campo) de vacíos; una fila es válida si no tiene ninguno
+    vacios = pd.DataFrame(
+        {campo: (df[campo].isna() | (df[campo] == "")).to_numpy() for campo in presentes},
+        index=df.index,
+    )
+    mascara_valida = ~vacios.any(axis=1)
+
+    # Caso habitual con datos limpios: nada que rechazar ni motivos que construir
+    if mascara_valida.all():
+        return df, df.iloc[0:0]
+
+    # La indexación booleana ya devuelve DataFrames nuevos; con Copy-on-Write
+    # no hace falta una segunda copia para poder modificarlos
+    df_valido = df[mascara_valida]
+    df_rechazado = df[~mascara_valida]
+
+    # Cada fila rechazada se resume en una máscara de bits de campos vacíos;
+    # el texto del motivo se construye una vez por combinación distinta
+    bits = vacios[~mascara_valida].to_numpy() @ (1 << np.arange(len(presentes)))
+    combinaciones, posiciones = np.unique(bits, return_inverse=True)
+    textos = np.array(
+        [
+            "; ".join(f"{campo} vacío" for j, campo in enumerate(presentes) if combinacion >> j & 1)
+            for combinacion in combinaciones
+        ],
+        dtype=object,
+    )
+    motivos_rechazo = textos[posiciones.ravel()]
+    df_rechazado["motivo_rechazo"] = motivos_rechazo
 
     if len(df_rechazado) > 0:
-        logger.warning(f"  ⚠ {len(df_rechazado)} filas rechazadas por campos vacíos")
+        logger.warning("  ⚠ %s filas rechazadas por campos vacíos", len(df_rechazado))
 
     return df_valido, df_rechazado
@@ -11,7 +11,11 @@ Contiene todas las funciones de validación de datos:
 """
 
 import re
-from typing import Optional
+from functools import lru_cache, wraps
+from typing import Optional, Tuple
+
+import numpy as np
+import pandas as pd
 
 try:
     from app.logger import get_logger
@@ -20,7 +24,87 @@ except ImportError:
 
 logger = get_logger("validators")
 
+# Patrones precompilados y tablas compartidas por todas las validaciones
+_DNI_RE = re.compile(r"^[0-9]{8}[A-Z]$")
+_CORREO_RE = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
+_FECHA_ISO_RE = re.compile(r"^\d{4}-\d{2}$")
+_FECHA_SLASH_RE = re.compile(r"^\d{2}/\d{2,4}$")
+_NOMBRE_RE = re.compile(r"^[a-zA-ZáéíóúÁÉÍÓÚñÑüÜ\s\-]+$")
+_COD_CLIENTE_RE = re.compile(r"^[A-Z]+\d+$")
+_NO_DIGITO_RE = re.compile(r"\D")
+_LETRAS_DNI = "TRWAGMYFPDXBNJZSQVHLCKE"
+_PREFIJOS_TELEFONO = frozenset("6789")
+_LETRAS_DNI_CODIGOS = np.array([ord(letra) for letra in _LETRAS_DNI], dtype=np.int32)
+_PESOS_DNI = 10 ** np.arange(7, -1, -1, dtype=np.int64)
+
+# Valores distintos recordados por cada validador escalar
+_TAMANO_CACHE = 100_000
+
+# Validadores con caché (ver limpiar_caches)
+_VALIDADORES_CON_CACHE = []
+
+
+def _con_cache(validador):
+    """
+    Memoriza el resultado de un validador escalar para entradas de texto.
+
+    Los valores no str (None, NaN, números) se validan sin caché, ya que no
+    todos son hashables y su resultado es inmediato. Los validadores de
+    número de tarjeta y CVV no se memorizan: sus entradas son datos
+    sensibles que no deben quedar en memoria entre ejecuciones.
+
+    Args:
+        validador: Función de validación de un único argumento
+
+    Returns:
+        Callable: Validador con caché (expone cache_info y cache_clear)
+    """
+    cacheado = lru_cache(maxsize=_TAMANO_CACHE)(validador)
+
+    @wraps(validador)
+    def envoltura(valor):
+        if isinstance(valor, str):
+            return cacheado(valor)
+        return validador(valor)
+
+    envoltura.cache_info = cacheado.cache_info
+    envoltura.cache_clear = cacheado.cache_clear
+    _VALIDADORES_CON_CACHE.append(envoltura)
+    return envoltura
+
+
+def limpiar_caches():
+    """
+    Vacía la caché de todos los validadores escalares.
+
+    Se llama al terminar cada ejecución del pipeline, para que los valores
+    validados (DNI, correos, teléfonos) no sigan en memoria en procesos de
+    larga duración como la ejecución programada.
+    """
+    for validador in _VALIDADORES_CON_CACHE:
+        validador.cache_clear()
+
+
+def _solo_digitos(valor) -> str:
+    """
+    Extrae los dígitos de un valor.
+
+    Los valores que ya son solo dígitos (lo habitual tras normalizar) se
+    devuelven tal cual, sin recorrerlos carácter a carácter.
+
+    Args:
+        valor: Valor del que extraer los dígitos
+
+    Returns:
+        str: Dígitos del valor
+    """
+    texto = str(valor)
+    if texto.isdecimal():
+        return texto
+    return _NO_DIGITO_RE.sub("", texto)
+
 
+@_con_cache
 def validar_dni(dni: str) -> bool:
     """
     Valida un DNI español.
@@ -37,18 +121,17 @@ def validar_dni(dni: str) -> bool:
     dni = dni.strip().upper()
 
     # Patrón: 8 dígitos + 1 letra
-    patron = r"^\d{8}[A-Z]$"
-    if not re.match(patron, dni):
+    if not _DNI_RE.match(dni):
         return False
 
     # Validar letra
-    letras = "TRWAGMYFPDXBNJZSQVHLCKE"
     numero = int(dni[:8])
-    letra_calculada = letras[numero % 23]
+    letra_calculada = _LETRAS_DNI[numero % 23]
 
     return dni[8] == letra_calculada
 
 
+@_con_cache
 def validar_telefono(telefono: str) -> bool:
     """
     Valida un teléfono español (móvil o fijo).
@@ -63,16 +146,17 @@ def validar_telefono(telefono: str) -> bool:
         return False
 
     # Extraer solo dígitos
-    telefono_limpio = "".join(filter(str.isdigit, str(telefono)))
+    telefono_limpio = _solo_digitos(telefono)
 
     # Debe tener 9 dígitos
     if len(telefono_limpio) != 9:
         return False
 
     # Debe empezar por 6, 7, 8 o 9
-    return telefono_limpio[0] in ["6", "7", "8", "9"]
+    return telefono_limpio[0] in _PREFIJOS_TELEFONO
 
 
+@_con_cache
 def validar_correo(correo: str) -> bool:
     """
     Valida un correo electrónico.
@@ -86,8 +170,7 @@ def validar_correo(correo: str) -> bool:
     if not isinstance(correo, str):
         return False
 
-    patron = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
-    return bool(re.match(patron, correo.strip()))
+    return bool(_CORREO_RE.match(correo.strip()))
 
 
 def validar_numero_tarjeta(numero: str) -> bool:
@@ -104,7 +187,7 @@ def validar_numero_tarjeta(numero: str) -> bool:
         return False
 
     # Extraer solo dígitos
-    digitos = "".join(filter(str.isdigit, str(numero)))
+    digitos = _solo_digitos(numero)
 
     # Debe tener entre 13 y 19 dígitos
     if len(digitos) < 13 or len(digitos) > 19:
@@ -139,10 +222,11 @@ def validar_cvv(cvv: str) -> bool:
     if not cvv:
         return False
 
-    cvv_limpio = "".join(filter(str.isdigit, str(cvv)))
+    cvv_limpio = _solo_digitos(cvv)
     return len(cvv_limpio) in [3, 4]
 
 
+@_con_cache
 def validar_fecha_expiracion(fecha_exp: str) -> bool:
     """
     Valida una fecha de expiración de tarjeta.
@@ -161,8 +245,7 @@ def validar_fecha_expiracion(fecha_exp: str) -> bool:
     fecha_exp = fecha_exp.strip()
 
     # Formato YYYY-MM
-    patron_iso = r"^\d{4}-\d{2}$"
-    if re.match(patron_iso, fecha_exp):
+    if _FECHA_ISO_RE.match(fecha_exp):
         try:
             año, mes = fecha_exp.split("-")
             mes_int = int(mes)
@@ -171,8 +254,7 @@ def validar_fecha_expiracion(fecha_exp: str) -> bool:
             return False
 
     # Formato MM/YY o MM/YYYY
-    patron_slash = r"^\d{2}/\d{2,4}$"
-    if re.match(patron_slash, fecha_exp):
+    if _FECHA_SLASH_RE.match(fecha_exp):
         try:
             mes, año = fecha_exp.split("/")
             mes_int = int(mes)
@@ -183,6 +265,7 @@ def validar_fecha_expiracion(fecha_exp: str) -> bool:
     return False
 
 
+@_con_cache
 def validar_nombre(nombre: str) -> bool:
     """
     Valida que un nombre solo contenga caracteres válidos.
@@ -197,10 +280,10 @@ def validar_nombre(nombre: str) -> bool:
         return False
 
     # Permite letras (incluyendo acentos), espacios y guiones
-    patron = r"^[a-zA-ZáéíóúÁÉÍÓÚñÑüÜ\s\-]+$"
-    return bool(re.fullmatch(patron, nombre.strip()))
+    return bool(_NOMBRE_RE.fullmatch(nombre.strip()))
 
 
+@_con_cache
 def validar_cod_cliente(cod: str) -> bool:
     """
     Valida un código de cliente.
@@ -215,5 +298,158 @@ def validar_cod_cliente(cod: str) -> bool:
         return False
 
     # Formato esperado: letra(s) seguida(s) de números (ej: C001, CLI123)
-    patron = r"^[A-Z]+\d+$"
-    return bool(re.match(patron, cod.strip().upper()))
+    return bool(_COD_CLIENTE_RE.match(cod.strip().upper()))
+
+
+# =============================================================================
+# VALIDACIONES POR LOTES
+# =============================================================================
+
+
+def validar_dni_array(dnis: np.ndarray) -> np.ndarray:
+    """
+    Valida una columna completa de DNIs sin bucle Python por fila.
+
+    Cada DNI (sin espacios y en mayúsculas) se convierte en su fila de
+    códigos UTF-32; dígitos, longitud y letra de control se comprueban con
+    operaciones de NumPy sobre esa matriz.
+
+    Args:
+        dnis: Array de DNIs (nulos o vacíos se consideran inválidos)
+
+    Returns:
+        np.ndarray: Array booleano con la validez de cada DNI
+    """
+    serie = pd.Series(dnis, dtype=str).str.strip().str.upper()
+    longitud_ok = (serie.str.len() == 9).to_numpy()
+
+    codigos = serie.fillna("").to_numpy(dtype="U9").view(np.int32).reshape(-1, 9)
+    digitos = codigos[:, :8] - ord("0")
+    digitos_ok = ((digitos >= 0) & (digitos <= 9)).all(axis=1)
+
+    numeros = digitos @ _PESOS_DNI
+    letra_ok = _LETRAS_DNI_CODIGOS[numeros % 23] == codigos[:, 8]
+
+    return longitud_ok & digitos_ok & letra_ok
+
+
+def validar_fecha_expiracion_series(serie: pd.Series) -> pd.Series:
+    """
+    Valida una columna completa de fechas de expiración.
+
+    Cada fecha (sin espacios) se convierte en su fila de códigos UTF-32 y
+    los formatos YYYY-MM, MM/YY y MM/YYYY se comprueban posición a posición
+    con NumPy; mismas reglas que validar_fecha_expiracion (nulos inválidos).
+
+    Args:
+        serie: Serie con fechas de expiración
+
+    Returns:
+        pd.Series: Serie booleana con la validez de cada fecha
+    """
+    texto = pd.Series(serie, dtype=str).str.strip()
+    longitud = texto.str.len().fillna(0).to_numpy(dtype=np.int64)
+
+    codigos = texto.fillna("").to_numpy(dtype="U7").view(np.int32).reshape(-1, 7)
+    es_digito = (codigos >= ord("0")) & (codigos <= ord("9"))
+    # En MM/YY[YY] el año tiene de 2 a 4 dígitos: el relleno no cuenta en contra
+    digito_o_relleno = es_digito | (np.arange(7) >= longitud[:, None])
+
+    iso = (
+        (longitud == 7)
+        & es_digito[:, :4].all(axis=1)
+        & (codigos[:, 4] == ord("-"))
+        & es_digito[:, 5:].all(axis=1)
+    )
+    barra = (
+        (longitud >= 5)
+        & (longitud <= 7)
+        & es_digito[:, :2].all(axis=1)
+        & (codigos[:, 2] == ord("/"))
+        & digito_o_relleno[:, 3:].all(axis=1)
+    )
+    cifras_mes = np.where(iso[:, None], codigos[:, 5:7], codigos[:, 0:2]) - ord("0")
+    mes = cifras_mes[:, 0] * 10 + cifras_mes[:, 1]
+    resultado = (iso | barra) & (mes >= 1) & (mes <= 12)
+
+    # Dígitos Unicode no ASCII (poco habituales) se resuelven con la versión escalar
+    no_ascii = ~texto.str.isascii().fillna(True).to_numpy(dtype=bool)
+    for i in np.flatnonzero(no_ascii):
+        resultado[i] = validar_fecha_expiracion(texto.iat[i])
+
+    return pd.Series(resultado, index=serie.index)
+
+
+def validar_correo_series(serie: pd.Series) -> pd.Series:
+    """
+    Valida una columna completa de correos con el patrón precompilado.
+
+    Mismas reglas que validar_correo (nulos o vacíos inválidos).
+
+    Args:
+        serie: Serie con correos
+
+    Returns:
+        pd.Series: Serie booleana con la validez de cada correo
+    """
+    texto = pd.Series(serie, dtype=str).str.strip()
+    validos = texto.str.match(_CORREO_RE, na=False).to_numpy(dtype=bool)
+    return pd.Series(validos, index=serie.index)
+
+
+def validar_telefono_series(serie: pd.Series) -> pd.Series:
+    """
+    Valida una columna completa de teléfonos sin bucle Python por fila.
+
+    Mismas reglas que validar_telefono: 9 dígitos empezando por 6, 7, 8 o 9
+    (nulos o vacíos inválidos).
+
+    Args:
+        serie: Serie con teléfonos
+
+    Returns:
+        pd.Series: Serie booleana con la validez de cada teléfono
+    """
+    digitos = pd.Series(serie, dtype=str).str.replace(_NO_DIGITO_RE, "", regex=True)
+    validos = (
+        digitos.str.len().eq(9).fillna(False).to_numpy(dtype=bool)
+        & digitos.str.slice(0, 1).isin(_PREFIJOS_TELEFONO).to_numpy(dtype=bool)
+    )
+    return pd.Series(validos, index=serie.index)
+
+
+def validar_clientes_batch(
+    dnis: Optional[np.ndarray],
+    telefonos: Optional[np.ndarray],
+    correos: Optional[np.ndarray],
+) -> Tuple[Optional[np.ndarray], Optional[np.ndarray], Optional[np.ndarray]]:
+    """
+    Valida DNI, teléfono y correo de todos los clientes por columnas.
+
+    Aplica las mismas reglas que validar_dni, validar_telefono y
+    validar_correo; los valores vacíos o nulos se consideran inválidos. Cada
+    campo se resuelve con su versión por columnas (validar_dni_array,
+    validar_telefono_series y validar_correo_series).
+
+    Args:
+        dnis: Array de DNIs (None si la columna no existe)
+        telefonos: Array de teléfonos (None si la columna no existe)
+        correos: Array de correos (None si la columna no existe)
+
+    Returns:
+        Tuple: Arrays booleanos (dni, teléfono, correo); None para las
+        columnas no recibidas
+    """
+    dni_ok = validar_dni_array(dnis) if dnis is not None else None
+    tel_ok = (
+        validar_telefono_series(pd.Series(telefonos)).to_numpy()
+        if telefonos is not None
+        else None
+    )
+    cor_ok = (
+        validar_correo_series(pd.Series(correos)).to_numpy()
+        if correos is not None
+        else None
+    )
+
+    return dni_ok, tel_ok, cor_ok
@@ -150,7 +150,7 @@ def main():
 
         # Ejecución programada
         if args.schedule:
-            logger.info(f"Iniciando automatización a las {args.schedule}...")
+            logger.info("Iniciando automatización a las %s...", args.schedule)
             iniciar_automatizacion(hora=args.schedule)
             return
 
@@ -191,7 +191,7 @@ def main():
         logger.info("Proceso interrumpido por el usuario")
         sys.exit(0)
     except Exception as e:
-        logger.error(f"Error: {e}")
+        logger.error("Error: %s", e)
         sys.exit(1)
 
 